@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for BasicMemoryDuckdb JSON loading (DuckDB scan vs per-file Python insert)
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the assetinsight app directory to Python path
+current_dir = Path(__file__).resolve().parent / 'zealot' / 'apps' / 'assetinsight'
+sys.path.insert(0, str(current_dir))
+
+from database.duckdb.memory.basic import BasicMemoryDuckdb
+
+
+ASSET_FILES = {
+    'servers.json': [
+        {
+            'id': 'a1', 'name': 'web-1', 'assetClass': 'servers', 'status': 'active',
+            'parent_cloud': 'PC1', 'cloud': 'C1', 'team': 'T1', 'deleted': False,
+            'properties_mbu': 'M1', 'properties_bu': 'B1', 'properties_cpu': 4,
+            'tags_env': 'prod', 'tags_owner': 'ops',
+            'assetAttributions': [{'parentCloud': {'name': 'PC1'}}]
+        },
+        {
+            # Empty and null values are dropped from properties/tags
+            'id': 'a2', 'name': '', 'assetClass': 'servers', 'status': None,
+            'parent_cloud': '', 'properties_mbu': '', 'properties_bu': None,
+            'tags_env': '', 'tags_team': 'T2'
+        },
+        'not an asset',
+    ],
+    'ec2.json': [
+        {'id': 'a3', 'name': 'ec2-1', 'assetClass': 'ec2', 'properties': {'mbu': 'nested'}, 'tags': {}},
+        {'id': 'a4'},
+    ],
+}
+
+
+def _write_fixtures(folder: Path, files: dict):
+    for filename, content in files.items():
+        (folder / filename).write_text(json.dumps(content), encoding='utf-8')
+
+
+def _load_rows(reader: BasicMemoryDuckdb, loader) -> list:
+    """Reload every fixture file with loader and return the assets rows"""
+    reader.conn.execute("DELETE FROM assets")
+    loader(sorted(reader.folder_path.glob('*.json')))
+    return _fetch_rows(reader)
+
+
+def _fetch_rows(reader: BasicMemoryDuckdb) -> list:
+    """Return the assets rows ordered by id, JSON columns decoded"""
+    json_columns = {
+        column_name for column_name, data_type in reader.conn.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'assets'"
+        ).fetchall() if data_type == 'JSON'
+    }
+    result = reader.conn.execute("SELECT * FROM assets ORDER BY id")
+    columns = [desc[0] for desc in result.description]
+    return [
+        {column: json.loads(value) if column in json_columns and value is not None else value
+         for column, value in zip(columns, row)}
+        for row in result.fetchall()
+    ]
+
+
+def test_native_load_matches_python_load():
+    """The single-statement DuckDB load must produce the same rows as the per-file Python insert"""
+    with tempfile.TemporaryDirectory() as folder:
+        _write_fixtures(Path(folder), ASSET_FILES)
+        reader = BasicMemoryDuckdb(folder)
+
+        native_rows = _load_rows(reader, reader._load_json_files_native)
+        python_rows = _load_rows(reader, reader._load_json_files_python)
+
+        assert len(native_rows) == 4
+        assert native_rows == python_rows
+        assert native_rows[0]['properties'] == {'mbu': 'M1', 'bu': 'B1', 'cpu': 4}
+        assert native_rows[1]['properties'] == {}
+        assert native_rows[1]['tags'] == {'team': 'T2'}
+
+
+def test_non_array_file_falls_back_to_python_load():
+    """A file that is not a JSON array fails the DuckDB scan and is loaded per file instead"""
+    with tempfile.TemporaryDirectory() as folder:
+        _write_fixtures(Path(folder), {**ASSET_FILES, 'single.json': {'id': 'a5', 'name': 'lonely'}})
+        reader = BasicMemoryDuckdb(folder)
+
+        try:
+            reader._load_json_files_native(sorted(reader.folder_path.glob('*.json')))
+        except Exception:
+            pass
+        else:
+            raise AssertionError("DuckDB scan accepted a non-array file")
+
+        # The load done at construction fell back and, like the Python loader,
+        # skips the non-array file
+        loaded_rows = _fetch_rows(reader)
+        python_rows = _load_rows(reader, reader._load_json_files_python)
+        assert [row['id'] for row in loaded_rows] == ['a1', 'a2', 'a3', 'a4']
+        assert loaded_rows == python_rows
+
+
+if __name__ == "__main__":
+    test_native_load_matches_python_load()
+    test_non_array_file_falls_back_to_python_load()
+    print("✅ JSON loading tests passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for OwnerAnalyser.get_all_distributions
+"""
+
+import sys
+from pathlib import Path
+
+# Add the assetinsight app directory to Python path
+current_dir = Path(__file__).resolve().parent / 'zealot' / 'apps' / 'assetinsight'
+sys.path.insert(0, str(current_dir))
+
+import duckdb
+from analyser.asset.owner import OwnerAnalyser
+
+
+class InMemoryReader:
+    """Minimal reader over an in-memory DuckDB connection (same contract as BasicMemoryDuckdb)"""
+
+    def __init__(self, setup_sql: str):
+        self.conn = duckdb.connect()
+        self.conn.execute(setup_sql)
+        self.failing = False
+
+    def execute_query(self, sql_query, as_tuples=False, parameters=None):
+        # Like BasicMemoryDuckdb, a failed query comes back as no rows
+        if self.failing and 'information_schema' not in sql_query:
+            return []
+        result = self.conn.execute(sql_query, parameters).fetchall()
+        if as_tuples:
+            return result
+        columns = [desc[0] for desc in self.conn.description]
+        return [dict(zip(columns, row)) for row in result]
+
+    def close(self):
+        self.conn.close()
+
+
+def _sorted_rows(rows):
+    return sorted(rows, key=lambda row: sorted((key, str(value)) for key, value in row.items()))
+
+
+def test_distributions_sharing_key_columns():
+    """MBU and BU resolving to the same column must both get their rows, once each"""
+    analyser = OwnerAnalyser()
+    analyser.reader = InMemoryReader("""
+        CREATE TABLE servers (parent_cloud VARCHAR, properties_mbu VARCHAR, properties_bu VARCHAR);
+        INSERT INTO servers VALUES ('PC1', 'M1', 'B1'), ('PC1', 'M1', 'B2'), ('PC2', 'M2', 'B1'), (NULL, '', NULL);
+    """)
+
+    distributions = analyser.get_all_distributions()
+    fields = analyser._get_distribution_fields(None)
+
+    # bu resolves onto the MBU column, so the mbu and bu sets share one grouping set
+    assert fields['bu'][0]['field'] == fields['mbu'][0]['field']
+
+    for name in ('parent_cloud', 'mbu', 'bu'):
+        expected = analyser.reader.execute_query(
+            analyser._build_multi_field_distribution_query(None, fields[name])
+        )
+        assert distributions[name], f"{name} distribution is empty"
+        assert _sorted_rows(distributions[name]) == _sorted_rows(expected), name
+
+
+def test_failed_distributions_are_not_cached():
+    """Distributions that came back empty from failed queries are retried on the next call"""
+    analyser = OwnerAnalyser()
+    analyser.reader = InMemoryReader("""
+        CREATE TABLE servers (parent_cloud VARCHAR, cloud VARCHAR, team VARCHAR);
+        INSERT INTO servers VALUES ('PC1', 'C1', 'T1'), ('PC2', 'C2', NULL);
+    """)
+
+    analyser.reader.failing = True
+    assert analyser.get_parent_cloud_distribution() == []
+
+    analyser.reader.failing = False
+    assert len(analyser.get_parent_cloud_distribution()) == 2
+
+
+def test_cached_distributions_are_not_shared():
+    """Changing a returned distribution must not leak into later calls"""
+    analyser = OwnerAnalyser()
+    analyser.reader = InMemoryReader("""
+        CREATE TABLE servers (parent_cloud VARCHAR, cloud VARCHAR, team VARCHAR);
+        INSERT INTO servers VALUES ('PC1', 'C1', 'T1'), ('PC2', 'C2', NULL);
+    """)
+
+    expected = analyser.get_parent_cloud_distribution()
+    analyser.get_all_distributions()['parent_cloud'].append('junk')
+    analyser.get_parent_cloud_distribution()[0]['total_assets'] = -1
+
+    assert analyser.get_parent_cloud_distribution() == expected
+
+
+if __name__ == "__main__":
+    test_distributions_sharing_key_columns()
+    test_failed_distributions_are_not_cached()
+    test_cached_distributions_are_not_shared()
+    print("✅ Distribution tests passed")
@@ -6,7 +6,7 @@ class with asset-specific functionality. It focuses on asset data processing
 and analysis patterns.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Sequence
 from abc import ABC, abstractmethod
 from ..base import Analyser
 
@@ -29,22 +29,22 @@ class AssetAnalyser(Analyser):
         super().__init__(analyser_type)
     
     @abstractmethod
-    def get_cloud_fields(self) -> List[str]:
+    def get_cloud_fields(self) -> Sequence[str]:
         """
-        Get the list of cloud fields specific to this analyser type.
+        Get the cloud fields specific to this analyser type.
         
         Returns:
-            List of cloud field names to extract
+            Sequence of cloud field names to extract (may be a shared constant)
         """
         pass
     
     @abstractmethod
-    def get_asset_fields(self) -> List[str]:
+    def get_asset_fields(self) -> Sequence[str]:
         """
-        Get the list of asset fields specific to this analyser type.
+        Get the asset fields specific to this analyser type.
         
         Returns:
-            List of asset field names to extract
+            Sequence of asset field names to extract (may be a shared constant)
         """
         pass
     
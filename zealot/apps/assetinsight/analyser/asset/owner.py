@@ -5,11 +5,69 @@ This analyser focuses on ownership, team assignments, and resource attribution
 aspects of asset data using DuckDB for efficient querying.
 """
 
-from typing import Any, Dict, List
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from .asset import AssetAnalyser
 from common.asset_class import AssetClass
 
 
+logger = logging.getLogger(__name__)
+
+
+def _quote(identifier: str) -> str:
+    """Quote a column name as a SQL identifier, escaping embedded double quotes."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _json_by_type(data_type: str) -> Optional[bool]:
+    """Tell from a column's declared type whether it holds JSON; None if values must be sampled."""
+    data_type = data_type.upper()
+    if data_type.startswith(('JSON', 'STRUCT', 'MAP')):
+        return True
+    if data_type == 'VARCHAR':
+        return None
+    return False
+
+
+def _struct_fields(data_type: str) -> List[str]:
+    """Return the top-level field names of a DuckDB STRUCT type string (empty if not a STRUCT)."""
+    if not data_type.upper().startswith('STRUCT('):
+        return []
+    names, depth, start = [], 0, len('STRUCT(')
+    for index, char in enumerate(data_type[start:], start):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if depth == 0 and char == ',' or depth < 0:
+            entry = data_type[start:index].strip()
+            names.append(entry[1:].split('"', 1)[0] if entry.startswith('"') else entry.split(' ', 1)[0])
+            start = index + 1
+        if depth < 0:
+            break
+    return names
+
+
+@lru_cache(maxsize=64)
+def _compile_terms(search_terms: Tuple[str, ...]) -> 're.Pattern':
+    """Compile search terms into one alternation so each column is scanned once."""
+    return re.compile('|'.join(map(re.escape, search_terms)))
+
+
+@lru_cache(maxsize=256)
+def _match_field(available_columns: Tuple[str, ...], search_terms: Tuple[str, ...]) -> Optional[str]:
+    """Return the first column whose lowercased name contains any search term (memoized)."""
+    if not search_terms:
+        return None
+    pattern = _compile_terms(search_terms)
+    for col in available_columns:
+        if pattern.search(col.lower()):
+            return col
+    return None
+
+
 class OwnerAnalyser(AssetAnalyser):
     """
     Concrete implementation of AssetAnalyser for owner-specific analysis.
@@ -18,29 +76,93 @@ class OwnerAnalyser(AssetAnalyser):
     aspects of asset data.
     """
     
+    # Fields extracted for ownership analysis (static, shared by every call)
+    ASSET_FIELDS = ('id', 'name', 'assetClass', 'status', 'organization', 'parent_cloud', 'cloud', 'team')
+    CLOUD_FIELDS = ('parent_cloud', 'cloud', 'team')
+    
+    # Distributions computed together by get_all_distributions
+    DISTRIBUTIONS = ('parent_cloud', 'cloud', 'team', 'mbu', 'bu')
+    # Rows sampled per table when probing whether a field holds JSON
+    JSON_PROBE_ROWS = 8
+    
     def __init__(self):
         """Initialize the owner analyser."""
         super().__init__("owner")
+        # Table/column metadata is static for a reader's lifetime
+        self._tables_cache: Optional[List[str]] = None
+        self._columns_cache: Dict[str, Tuple[str, ...]] = {}
+        self._column_types: Dict[Tuple[str, str], str] = {}
+        self._columns_loaded = False
+        self._json_field_cache: Dict[Tuple[Optional[str], str], bool] = {}
+        # Query results, also immutable for the reader's lifetime
+        self._result_cache: Dict[Tuple, Any] = {}
+        self._metadata_reader = None
     
-    def _create_union_query(self, base_query: str) -> str:
-        """Create a UNION query across all asset tables"""
-        table_names = self._get_existing_database_tables()
+    def create_reader(self, source_directory: str) -> None:
+        """
+        Create a database reader and reset cached metadata.
+        
+        Args:
+            source_directory: Path to source directory
+        """
+        super().create_reader(source_directory)
+        self.invalidate_metadata_cache()
+    
+    def close_reader(self) -> None:
+        """Close the reader and drop cached metadata."""
+        super().close_reader()
+        self.invalidate_metadata_cache()
+    
+    def invalidate_metadata_cache(self) -> None:
+        """Forget cached table and column metadata (call after changing the schema)."""
+        self._tables_cache = None
+        self._columns_cache = {}
+        self._column_types = {}
+        self._columns_loaded = False
+        self._json_field_cache = {}
+        self._result_cache = {}
+        self._metadata_reader = self.reader
+    
+    def _check_metadata_cache(self) -> None:
+        """Invalidate cached metadata if the reader was swapped without create_reader()."""
+        if self._metadata_reader is not self.reader:
+            self.invalidate_metadata_cache()
+    
+    def _union_raw(self, columns: str, table_names: List[str] = None, suffix: str = "") -> str:
+        """
+        UNION ALL a raw row projection across asset tables.
         
-        print(f"🔍 Creating UNION query across tables: {table_names}")
+        Aggregation is applied once on top of the combined rows by the caller,
+        so each table contributes only the projected columns and DuckDB builds a
+        single hash aggregate instead of one per table.
         
-        # Create UNION query for each table
-        union_parts = []
-        for table_name in table_names:
-            # Replace 'FROM assets' with 'FROM {table_name}' in the query
-            table_query = base_query.replace('FROM assets', f'FROM {table_name}')
-            union_parts.append(f"({table_query})")
+        Args:
+            columns: Projection list of the row-level query (no aggregation)
+            table_names: Tables to combine (default: all existing tables)
+            suffix: Clause appended to each table's query (e.g. " LIMIT 1")
+            
+        Returns:
+            SQL query string
+        """
+        if table_names is None:
+            table_names = self._get_existing_database_tables()
+        
+        logger.debug("Creating UNION query across tables: %s", table_names)
         
-        union_query = " UNION ALL ".join(union_parts)
-        print(f"🔍 Generated UNION query: {union_query[:200]}...")  # Show first 200 chars
+        # Create UNION query for each table
+        union_query = " UNION ALL ".join(
+            f"(SELECT {columns} FROM {table_name}{suffix})"
+            for table_name in table_names
+        )
+        logger.debug("Generated UNION query: %.200s...", union_query)
         
-        result_list = list(combined.values())
-        result_list.sort(key=lambda x: x['total_assets'], reverse=True)
-        return result_list
+        return union_query
+    
+    def _row_source(self, table_name: str, columns: str) -> str:
+        """Return the row projection for a specific table, or UNIONed across all tables when table_name is None."""
+        if table_name:
+            return f"SELECT {columns} FROM {table_name}"
+        return self._union_raw(columns)
     
     def analyse(self, source_directory: str, result_directory: str) -> Dict[str, Any]:
         """
@@ -70,26 +192,23 @@ class OwnerAnalyser(AssetAnalyser):
         finally:
             self.close_reader()
     
-    def get_asset_fields(self) -> List[str]:
+    def get_asset_fields(self) -> Tuple[str, ...]:
         """
-        Get the list of asset fields specific to ownership analysis.
+        Get the asset fields specific to ownership analysis.
         
         Returns:
-            List of asset field names to extract
+            Tuple of asset field names to extract
         """
-        return [
-            'id', 'name', 'assetClass', 'status', 'organization',
-            'parent_cloud', 'cloud', 'team'
-        ]
+        return self.ASSET_FIELDS
     
-    def get_cloud_fields(self) -> List[str]:
+    def get_cloud_fields(self) -> Tuple[str, ...]:
         """
-        Get the list of cloud fields specific to ownership analysis.
+        Get the cloud fields specific to ownership analysis.
         
         Returns:
-            List of cloud field names to extract
+            Tuple of cloud field names to extract
         """
-        return ['parent_cloud', 'cloud', 'team']
+        return self.CLOUD_FIELDS
     
     def process_asset_specific_data(self, asset: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -105,184 +224,189 @@ class OwnerAnalyser(AssetAnalyser):
         # No additional processing needed
         return asset
     
-    def get_ownership_summary(self, asset_class: str = None) -> Dict[str, Any]:
-        """Get ownership summary statistics"""
+    def get_ownership_summary(self, asset_class: str = None, approximate: bool = False) -> Dict[str, Any]:
+        """
+        Get ownership summary statistics across all asset tables.
+        
+        Args:
+            asset_class: Optional asset class name to restrict the summary to its table
+            approximate: Estimate distinct parent cloud/cloud/team counts with
+                HyperLogLog (approx_count_distinct, typically within a few percent)
+                instead of exact COUNT(DISTINCT); cheaper on high-cardinality data
+            
+        Returns:
+            Dictionary containing ownership summary data; counts stay 0 if the
+            reader reports a failed query as an empty result
+            
+        Raises:
+            ValueError: If reader is not initialized or the summary query fails
+        """
         if not self.reader:
             raise ValueError("Reader not initialized. Call create_reader() first.")
         
         try:
-            # First, let's check what columns are available in the first available table
             table_names = self._get_existing_database_tables()
             if not table_names:
                 return {"error": "No asset tables found"}
             
-            # Get column info
-            first_table = table_names[0]
-            columns_result = self.reader.execute_query(f"PRAGMA table_info({first_table})")
-            available_columns = [col['name'] for col in columns_result] if columns_result else []
-            
-            # Find ownership fields
-            parent_cloud_field = next((col for col in available_columns if 'parentCloud.name' in col or 'parent_cloud' in col), None)
-            cloud_field = next((col for col in available_columns if 'cloud.name' in col or 'cloud' in col), None)
-            team_field = next((col for col in available_columns if 'team.name' in col or 'team' in col), None)
-            
-            # Get total assets
             if asset_class:
-                table_name = self._get_table_name(asset_class)
-                total_assets = self._query_single_table("SELECT COUNT(*) as total FROM {table}", table_name)[0]['total'] if table_name else 0
-            else:
-                total_assets = sum(self._query_single_table("SELECT COUNT(*) as total FROM {table}", tn)[0]['total'] for tn in table_names)
-            
-            # Get counts for each field
-            total_parent_clouds = self._get_distinct_count(parent_cloud_field, asset_class) if parent_cloud_field else 0
-            total_clouds = self._get_distinct_count(cloud_field, asset_class) if cloud_field else 0
-            total_teams = self._get_distinct_count(team_field, asset_class) if team_field else 0
+                try:
+                    table_name = AssetClass.from_string(asset_class).table_name
+                except ValueError:
+                    table_name = None
+                table_names = [table_name] if table_name in table_names else []
             
-            # Get unowned assets
-            unowned_conditions = [f'("{field}" IS NULL OR "{field}" = \'\')' for field in [parent_cloud_field, cloud_field, team_field] if field]
-            total_assets_unowned = self._get_unowned_count(unowned_conditions, asset_class) if unowned_conditions else 0
-            
-            return {
-                'total_parent_clouds': total_parent_clouds,
-                'total_clouds': total_clouds,
-                'total_assets': total_assets,
-                'total_assets_unowned': total_assets_unowned,
-                'total_teams': total_teams,
-                'debug_info': {
-                    'available_columns': available_columns,
-                    'parent_cloud_field': parent_cloud_field,
-                    'cloud_field': cloud_field,
-                    'team_field': team_field
-                }
-            }
+            available_columns = self._get_table_and_columns(table_names[0])[2] if table_names else []
+            return self._query_ownership_summary(table_names, available_columns, approximate)
             
         except Exception as e:
             raise ValueError(f"Failed to get ownership summary: {str(e)}")
     
-    def get_ownership_summary_for_table(self, table_name: str) -> Dict[str, Any]:
+    def get_ownership_summary_for_table(self, table_name: str, approximate: bool = False) -> Dict[str, Any]:
         """
         Get ownership summary statistics for a specific table.
         
         Args:
             table_name: Name of the table to query
+            approximate: Estimate distinct counts (see get_ownership_summary)
             
         Returns:
-            Dictionary containing ownership summary data
+            Dictionary containing ownership summary data; counts stay 0 if the
+            reader reports a failed query as an empty result
             
         Raises:
-            ValueError: If reader is not initialized
+            ValueError: If reader is not initialized or the summary query fails
         """
         if not self.reader:
             raise ValueError("Reader not initialized. Call create_reader() first.")
         
         try:
-            # Get column info from the specified table
-            columns_result = self.reader.execute_query(f"PRAGMA table_info({table_name})")
-            available_columns = [col['name'] for col in columns_result] if columns_result else []
-            
-            # Get total assets from this table
-            total_assets_result = self.reader.execute_query(f"SELECT COUNT(*) as total FROM {table_name}")
-            total_assets = total_assets_result[0]['total'] if total_assets_result else 0
-            
-            # Check for flattened attribution fields
-            parent_cloud_field = None
-            cloud_field = None
-            team_field = None
-            
-            for col in available_columns:
-                if 'parentCloud.name' in col or 'parent_cloud' in col:
-                    parent_cloud_field = col
-                elif 'cloud.name' in col or 'cloud' in col:
-                    cloud_field = col
-                elif 'team.name' in col or 'team' in col:
-                    team_field = col
-            
-            # Get totals for each field
-            total_parent_clouds = 0
-            total_clouds = 0
-            total_teams = 0
-            total_assets_unowned = 0
-            
-            if parent_cloud_field:
-                try:
-                    result = self.reader.execute_query(f"""
-                        SELECT COUNT(DISTINCT COALESCE(NULLIF("{parent_cloud_field}", ''), 'Zombie')) as total 
-                        FROM {table_name}
-                    """)
-                    total_parent_clouds = result[0]['total'] if result else 0
-                except Exception:
-                    total_parent_clouds = 0
-            
-            if cloud_field:
-                try:
-                    result = self.reader.execute_query(f"""
-                        SELECT COUNT(DISTINCT COALESCE(NULLIF("{cloud_field}", ''), 'Zombie')) as total 
-                        FROM {table_name}
-                    """)
-                    total_clouds = result[0]['total'] if result else 0
-                except Exception:
-                    total_clouds = 0
-            
-            if team_field:
-                try:
-                    result = self.reader.execute_query(f"""
-                        SELECT COUNT(DISTINCT COALESCE(NULLIF("{team_field}", ''), 'Zombie')) as total 
-                        FROM {table_name}
-                    """)
-                    total_teams = result[0]['total'] if result else 0
-                except Exception:
-                    total_teams = 0
+            _, _, available_columns = self._get_table_and_columns(table_name)
+            summary = self._query_ownership_summary([table_name], available_columns, approximate)
+            summary['table_name'] = table_name
+            return summary
             
-            # Get total assets unowned
-            unowned_conditions = []
-            if parent_cloud_field:
-                unowned_conditions.append(f'("{parent_cloud_field}" IS NULL OR "{parent_cloud_field}" = \'\')')
-            if cloud_field:
-                unowned_conditions.append(f'("{cloud_field}" IS NULL OR "{cloud_field}" = \'\')')
-            if team_field:
-                unowned_conditions.append(f'("{team_field}" IS NULL OR "{team_field}" = \'\')')
+        except Exception as e:
+            raise ValueError(f"Failed to get ownership summary for table {table_name}: {str(e)}")
+    
+    def _get_ownership_fields(self, available_columns: List[str]) -> Tuple[str, str, str]:
+        """
+        Find the parent cloud, cloud and team columns.
+        
+        Args:
+            available_columns: List of column names
             
-            if unowned_conditions:
-                try:
-                    unowned_query = f"""
-                        SELECT COUNT(*) as total 
-                        FROM {table_name} 
-                        WHERE {' AND '.join(unowned_conditions)}
-                    """
-                    result = self.reader.execute_query(unowned_query)
-                    total_assets_unowned = result[0]['total'] if result else 0
-                except Exception:
-                    total_assets_unowned = 0
+        Returns:
+            Tuple of (parent_cloud_field, cloud_field, team_field), None where not found
+        """
+        parent_cloud_field = self._find_field(available_columns, ['parentcloud.name', 'parent_cloud'])
+        # 'cloud' also matches the parent cloud columns, so leave those out
+        cloud_columns = [col for col in available_columns if 'parent' not in col.lower()]
+        cloud_field = self._find_field(cloud_columns, ['cloud.name', 'cloud'])
+        team_field = self._find_field(available_columns, ['team.name', 'team'])
+        return parent_cloud_field, cloud_field, team_field
+    
+    def _query_ownership_summary(self, table_names: List[str], available_columns: List[str],
+                                 approximate: bool = False) -> Dict[str, Any]:
+        """
+        Compute all ownership summary metrics in a single query.
+        
+        Total, distinct parent clouds/clouds/teams and unowned assets are
+        aggregated together so the data is scanned once rather than once per metric.
+        
+        Args:
+            table_names: Tables to summarise (UNIONed when more than one)
+            available_columns: Columns of the first table
+            approximate: Use approx_count_distinct for the distinct counts
             
-            return {
-                'total_parent_clouds': total_parent_clouds,
-                'total_clouds': total_clouds,
-                'total_assets': total_assets,
-                'total_assets_unowned': total_assets_unowned,
-                'total_teams': total_teams,
-                'table_name': table_name,
-                'debug_info': {
-                    'available_columns': available_columns,
-                    'parent_cloud_field': parent_cloud_field,
-                    'cloud_field': cloud_field,
-                    'team_field': team_field
-                }
+        Returns:
+            Dictionary containing ownership summary data
+        """
+        parent_cloud_field, cloud_field, team_field = self._get_ownership_fields(available_columns)
+        fields = [field for field in (parent_cloud_field, cloud_field, team_field) if field]
+        
+        distinct_count = "approx_count_distinct({})" if approximate else "COUNT(DISTINCT {})"
+        select_parts = ["COUNT(*) as total_assets"]
+        for output_name, field in (('total_parent_clouds', parent_cloud_field),
+                                   ('total_clouds', cloud_field),
+                                   ('total_teams', team_field)):
+            if field:
+                value_expr = f"COALESCE(NULLIF({_quote(field)}, ''), 'Zombie')"
+                select_parts.append(f"{distinct_count.format(value_expr)} as {output_name}")
+        
+        unowned_conditions = [f"({_quote(field)} IS NULL OR {_quote(field)} = '')" for field in fields]
+        if unowned_conditions:
+            select_parts.append(
+                f"COUNT(*) FILTER (WHERE {' AND '.join(unowned_conditions)}) as total_assets_unowned"
+            )
+        
+        summary = {
+            'total_parent_clouds': 0,
+            'total_clouds': 0,
+            'total_assets': 0,
+            'total_assets_unowned': 0,
+            'total_teams': 0,
+            'debug_info': {
+                'available_columns': list(available_columns),
+                'parent_cloud_field': parent_cloud_field,
+                'cloud_field': cloud_field,
+                'team_field': team_field
             }
-            
-        except Exception as e:
-            raise ValueError(f"Failed to get ownership summary for table {table_name}: {str(e)}")
+        }
+        # No columns means the table is not there; skip the query that would fail
+        if not table_names or not available_columns:
+            return summary
+        
+        self._check_metadata_cache()
+        cache_key = ('summary', tuple(table_names), approximate)
+        if cache_key in self._result_cache:
+            return {**summary, **self._result_cache[cache_key]}
+        
+        if len(table_names) == 1:
+            source = table_names[0]
+        else:
+            # Only the ownership columns are needed from each table
+            columns = ', '.join(map(_quote, fields)) or '1'
+            source = f"({self._union_raw(columns, table_names)})"
+        
+        # Errors propagate to the public wrappers, which raise ValueError; a reader
+        # that swallows them (BasicMemoryDuckdb returns []) leaves the zero-filled
+        # summary in place, uncached so the next call retries
+        result = self.reader.execute_query(f"SELECT {', '.join(select_parts)} FROM {source}")
+        
+        if result:
+            counts = {
+                key: result[0].get(key) or 0
+                for key in ('total_parent_clouds', 'total_clouds', 'total_assets', 'total_assets_unowned', 'total_teams')
+            }
+            self._result_cache[cache_key] = counts
+            summary.update(counts)
+        
+        return summary
     
     def _get_existing_database_tables(self) -> List[str]:
-        """Get list of tables that actually exist in the database"""
+        """Get list of tables that actually exist in the database (cached per reader)"""
+        self._check_metadata_cache()
+        if self._tables_cache is not None:
+            return list(self._tables_cache)
+        
         try:
-            tables_result = self.reader.execute_query("SHOW TABLES")
-            table_names = [table['name'] if isinstance(table, dict) else table[0] for table in tables_result] if tables_result else []
-            return table_names
+            tables_result = self.reader.execute_query("""
+                SELECT table_name
+                FROM information_schema.tables
+                WHERE table_schema = current_schema()
+                ORDER BY table_name
+            """)
+            table_names = [row['table_name'] for row in tables_result or []]
+            # Don't cache an empty result; it may come from a failed query
+            if table_names:
+                self._tables_cache = table_names
+            return list(table_names)
         except Exception as e:
-            print(f"❌ Error getting database tables: {e}")
+            logger.exception("Error getting database tables")
             return []
     
-    def _get_table_and_columns(self, table_name: str = None) -> tuple[List[str], str, List[str]]:
+    def _get_table_and_columns(self, table_name: str = None) -> tuple[List[str], str, Tuple[str, ...]]:
         """
         Get table names, first table, and available columns.
         
@@ -290,7 +414,7 @@ class OwnerAnalyser(AssetAnalyser):
             table_name: Optional specific table to use
             
         Returns:
-            Tuple of (list of table names, first_table, list of column names)
+            Tuple of (list of table names, first_table, tuple of column names)
         """
         if table_name:
             table_names = [table_name]
@@ -301,10 +425,53 @@ class OwnerAnalyser(AssetAnalyser):
                 return [], "", []
             first_table = table_names[0]
         
-        columns_result = self.reader.execute_query(f"PRAGMA table_info({first_table})")
-        available_columns = [col['name'] for col in columns_result] if columns_result else []
+        return table_names, first_table, self._get_columns(first_table)
+    
+    def _load_all_columns(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Load column names of every asset table in a single catalog query.
+        
+        Returns:
+            Dictionary mapping table name to its column names in ordinal order
+        """
+        self._check_metadata_cache()
+        if self._columns_loaded:
+            return self._columns_cache
         
-        return table_names, first_table, available_columns
+        table_names = self._get_existing_database_tables()
+        if table_names:
+            columns_result = self.reader.execute_query("""
+                SELECT table_name, column_name, data_type
+                FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name IN (SELECT unnest(?::VARCHAR[]))
+                ORDER BY table_name, ordinal_position
+            """, as_tuples=True, parameters=[table_names])
+            columns_by_table: Dict[str, List[str]] = {}
+            for owner_table, column_name, data_type in columns_result or []:
+                columns_by_table.setdefault(owner_table, []).append(column_name)
+                self._column_types[(owner_table, column_name)] = data_type
+            self._columns_cache.update((table, tuple(columns)) for table, columns in columns_by_table.items())
+            # Only mark loaded on success; a failed query falls back to per-table lookups
+            self._columns_loaded = bool(columns_by_table)
+        
+        return self._columns_cache
+    
+    def _get_columns(self, table_name: str) -> Tuple[str, ...]:
+        """Get column names of a table (cached per reader, as a tuple ready for field matching)."""
+        available_columns = self._load_all_columns().get(table_name)
+        if available_columns is None:
+            columns_result = self.reader.execute_query("""
+                SELECT column_name, data_type
+                FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = ?
+                ORDER BY ordinal_position
+            """, as_tuples=True, parameters=[table_name])
+            available_columns = tuple(column_name for column_name, _ in columns_result or [])
+            for column_name, data_type in columns_result or []:
+                self._column_types[(table_name, column_name)] = data_type
+            if available_columns:
+                self._columns_cache[table_name] = available_columns
+        return available_columns
     
     def _find_field(self, available_columns: List[str], search_terms: List[str]) -> str:
         """
@@ -317,15 +484,17 @@ class OwnerAnalyser(AssetAnalyser):
         Returns:
             Found field name or None
         """
-        for col in available_columns:
-            if any(term in col.lower() for term in search_terms):
-                return col
-        return None
+        return _match_field(tuple(available_columns), tuple(search_terms))
     
     def _is_json_field(self, table_name: str, field_name: str) -> bool:
         """
         Check if a field contains JSON data.
         
+        JSON, STRUCT and MAP columns are JSON and other non-text columns are not,
+        judging by the cached column types. Only VARCHAR columns (or unknown
+        types) are sampled: a few rows are tested server-side and the field
+        counts as JSON when any of them parses as a JSON object or array.
+        
         Args:
             table_name: Table to query (None for UNION)
             field_name: Field to check
@@ -333,60 +502,71 @@ class OwnerAnalyser(AssetAnalyser):
         Returns:
             True if field contains JSON data
         """
+        self._check_metadata_cache()
+        cache_key = (table_name, field_name)
+        if cache_key in self._json_field_cache:
+            return self._json_field_cache[cache_key]
+        
+        table_names = [table_name] if table_name else self._get_existing_database_tables()
+        for table in table_names:
+            self._get_columns(table)
+        data_types = [self._column_types.get((table, field_name)) for table in table_names]
+        if data_types and all(data_types):
+            verdicts = {_json_by_type(data_type) for data_type in data_types}
+            if len(verdicts) == 1 and None not in verdicts:
+                is_json = verdicts.pop()
+                self._json_field_cache[cache_key] = is_json
+                return is_json
+        
         try:
+            column = f"{_quote(field_name)} AS v"
             if table_name:
-                sample_query = f"SELECT \"{field_name}\" FROM {table_name} LIMIT 1"
+                sample_query = f"SELECT {column} FROM {table_name} LIMIT {self.JSON_PROBE_ROWS}"
             else:
-                sample_query = self._create_union_query(f"SELECT \"{field_name}\" FROM assets LIMIT 1")
-            
-            sample_result = self.reader.execute_query(sample_query)
-            if sample_result and sample_result[0].get(field_name):
-                sample_value = sample_result[0].get(field_name, '')
-                return isinstance(sample_value, str) and (sample_value.startswith('{') or sample_value.startswith('['))
-            return False
+                sample_query = self._union_raw(column, suffix=f" LIMIT {self.JSON_PROBE_ROWS}")
+            
+            probe_result = self.reader.execute_query(f"""
+                SELECT COUNT(*) FILTER (
+                    WHERE json_type(try_cast(v AS JSON)) IN ('OBJECT', 'ARRAY')
+                ) > 0 as is_json
+                FROM ({sample_query})
+            """)
+            if not probe_result:
+                return False
+            is_json = bool(probe_result[0].get('is_json'))
+            self._json_field_cache[cache_key] = is_json
+            return is_json
         except Exception:
             return False
     
-    def _build_distribution_query(self, table_name: str, field_name: str, output_name: str, 
-                                    is_json: bool = False, json_path: str = None) -> str:
+    def _field_value_expr(self, table_name: str, field_config: Dict[str, Any]) -> str:
         """
-        Build a distribution query for a single field.
+        Build the SQL expression reading a distribution field's raw value.
+        
+        JSON paths on STRUCT columns that have the key in every queried table
+        use direct struct field access instead of JSON_EXTRACT_STRING, which
+        would serialise the struct to JSON text and re-parse it per row.
         
         Args:
             table_name: Specific table name or None for UNION across all tables
-            field_name: Name of the field to query
-            output_name: Name of the output column
-            is_json: Whether the field contains JSON data
-            json_path: JSON path to extract (e.g., '$.mbu')
+            field_config: Dict with 'field', 'is_json', 'json_path'
             
         Returns:
-            SQL query string
-        """
-        # Determine if we need JSON extraction
-        if is_json and json_path:
-            value_expr = f"JSON_EXTRACT_STRING(\"{field_name}\", '{json_path}')"
-            output_expr = f"COALESCE(NULLIF({value_expr}, ''), 'Unknown {output_name}')"
-        else:
-            value_expr = f"\"{field_name}\""
-            output_expr = f"COALESCE(NULLIF({value_expr}, ''), 'Zombie')"
-        
-        base_query = f"""
-            SELECT 
-                {output_expr} as {output_name},
-                COUNT(*) as total_assets,
-                SUM(CASE 
-                    WHEN ({value_expr} IS NULL OR {value_expr} = '') 
-                    THEN 1 ELSE 0 
-                END) as unowned_assets
-            FROM {{table}}
-            GROUP BY {output_expr}
-            ORDER BY total_assets DESC
+            SQL expression string
         """
+        field = field_config['field']
+        json_path = field_config.get('json_path')
+        if not (field_config.get('is_json') and json_path):
+            return _quote(field)
         
-        if table_name:
-            return base_query.replace("{table}", table_name)
-        else:
-            return self._create_union_query(base_query.replace("{table}", "assets"))
+        key = json_path[2:] if json_path.startswith('$.') else ''
+        if key.isidentifier():
+            table_names = [table_name] if table_name else self._get_existing_database_tables()
+            data_types = [self._column_types.get((table, field)) for table in table_names]
+            if data_types and all(data_type and key in _struct_fields(data_type) for data_type in data_types):
+                return f"CAST({_quote(field)}.{_quote(key)} AS VARCHAR)"
+        
+        return f"JSON_EXTRACT_STRING({_quote(field)}, '{json_path}')"
     
     def _build_multi_field_distribution_query(self, table_name: str, fields_config: List[Dict]) -> str:
         """
@@ -399,51 +579,162 @@ class OwnerAnalyser(AssetAnalyser):
         Returns:
             SQL query string
         """
-        def get_field_expr(field_config):
-            if field_config.get('is_json') and field_config.get('json_path'):
-                return f"JSON_EXTRACT_STRING(\"{field_config['field']}\", '{field_config['json_path']}')"
-            else:
-                return f"\"{field_config['field']}\""
-        
-        def get_output_expr(field_config):
-            value_expr = get_field_expr(field_config)
+        def get_output_expr(index, field_config):
             output_name = field_config['output']
             if field_config.get('is_json'):
-                return f"COALESCE(NULLIF({value_expr}, ''), 'Unknown {output_name}')"
+                return f"COALESCE(NULLIF(v{index}, ''), 'Unknown {output_name}')"
             else:
-                return f"COALESCE(NULLIF({value_expr}, ''), 'Zombie')"
+                return f"COALESCE(NULLIF(v{index}, ''), 'Zombie')"
+        
+        # Project the raw values first, then aggregate once over all rows
+        row_columns = [f"{self._field_value_expr(table_name, fc)} AS v{i}" for i, fc in enumerate(fields_config)]
+        row_source = self._row_source(table_name, ', '.join(row_columns))
         
         # Build SELECT clause
-        select_parts = [f"{get_output_expr(fc)} as {fc['output']}" for fc in fields_config]
+        select_parts = [f"{get_output_expr(i, fc)} as {fc['output']}" for i, fc in enumerate(fields_config)]
         select_parts.extend([
             "COUNT(*) as total_assets",
-            f"SUM(CASE WHEN ({get_field_expr(fields_config[0])} IS NULL OR {get_field_expr(fields_config[0])} = '') THEN 1 ELSE 0 END) as unowned_assets"
+            "COUNT(*) FILTER (WHERE v0 IS NULL OR v0 = '') as unowned_assets"
         ])
         
-        # Build GROUP BY clause
-        group_by_parts = [get_output_expr(fc) for fc in fields_config]
+        # Group on the projected aliases so each key expression is evaluated once
+        group_by_parts = [fc['output'] for fc in fields_config]
         
-        base_query = f"""
+        return f"""
             SELECT {', '.join(select_parts)}
-            FROM {{table}}
+            FROM ({row_source})
             GROUP BY {', '.join(group_by_parts)}
             ORDER BY total_assets DESC
         """
+    
+    def _get_distribution_fields(self, table_name: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resolve the field configuration of each distribution.
         
-        if table_name:
-            return base_query.replace("{table}", table_name)
-        else:
-            return self._create_union_query(base_query.replace("{table}", "assets"))
+        Args:
+            table_name: Specific table name or None for all tables
+            
+        Returns:
+            Dictionary mapping distribution name to its fields config (see
+            _build_multi_field_distribution_query); distributions whose field
+            is missing are left out
+        """
+        _, _, available_columns = self._get_table_and_columns(table_name)
+        parent_cloud_field, cloud_field, team_field = self._get_ownership_fields(available_columns)
+        
+        # MBU/BU may live in their own columns or inside a properties JSON column
+        mbu_field = self._find_field(available_columns, ['properties_mbu', 'mbu', 'properties.mbu'])
+        bu_field = self._find_field(available_columns, ['properties_bu', 'bu', 'properties.bu', 'business_unit'])
+        properties_field = self._find_field(available_columns, ['properties'])
+        
+        fields = {}
+        if parent_cloud_field:
+            fields['parent_cloud'] = [{'field': parent_cloud_field, 'output': 'parent_cloud'}]
+        if cloud_field:
+            fields['cloud'] = [{'field': cloud_field, 'output': 'cloud'}]
+        if team_field:
+            fields['team'] = [{'field': team_field, 'output': 'team'}]
+        
+        mbu_dist_field = mbu_field or properties_field
+        if mbu_dist_field:
+            fields['mbu'] = [{
+                'field': mbu_dist_field, 'output': 'mbu',
+                'is_json': self._is_json_field(table_name, mbu_dist_field), 'json_path': '$.mbu'
+            }]
+        
+        bu_dist_field = bu_field or properties_field
+        if bu_dist_field:
+            bu_mbu_field = mbu_field or bu_dist_field  # Use same field for MBU
+            fields['bu'] = [
+                {'field': bu_dist_field, 'output': 'bu',
+                 'is_json': self._is_json_field(table_name, bu_dist_field), 'json_path': '$.bu'},
+                {'field': bu_mbu_field, 'output': 'mbu',
+                 'is_json': self._is_json_field(table_name, bu_mbu_field), 'json_path': '$.mbu'}
+            ]
+        
+        return fields
     
-    def get_parent_cloud_distribution(self, table_name: str = None) -> List[Dict[str, Any]]:
+    def _build_all_distributions_query(self, table_name: str, fields: Dict[str, List[Dict[str, Any]]]) -> Tuple[str, Dict[str, Tuple[int, List[int], int, int]]]:
         """
-        Get ownership distribution by parent cloud using DuckDB SQL query.
+        Build one GROUPING SETS query computing every distribution in a single pass.
+        
+        Args:
+            table_name: Specific table name or None for UNION across all tables
+            fields: Fields config per distribution from _get_distribution_fields
+            
+        Returns:
+            Tuple of (SQL query string, mapping of distribution name to
+            (grouping id, key column positions, total_assets position,
+            unowned_assets position)); the grouping id is column 0 and may be
+            shared by distributions over the same key columns
+        """
+        row_columns = []
+        key_exprs = []
+        key_index = {}
+        distribution_keys = {}
+        
+        for name, fields_config in fields.items():
+            keys = []
+            for field_config in fields_config:
+                value_expr = self._field_value_expr(table_name, field_config)
+                if field_config.get('is_json') and field_config.get('json_path'):
+                    default = f"Unknown {field_config['output']}"
+                else:
+                    default = 'Zombie'
+                # Distributions sharing a field (MBU in the mbu and bu sets) share
+                # one projected column, so the JSON is extracted once per row
+                index = key_index.get((value_expr, default))
+                if index is None:
+                    index = key_index[(value_expr, default)] = len(row_columns)
+                    row_columns.append(f"{value_expr} AS v{index}")
+                    key_exprs.append(f"COALESCE(NULLIF(v{index}, ''), '{default}') as k{index}")
+                keys.append(index)
+            distribution_keys[name] = keys
+        
+        key_count = len(key_exprs)
+        all_keys = ', '.join(f"k{i}" for i in range(key_count))
+        select_parts = [f"GROUPING({all_keys}) as gid"] + key_exprs + ["COUNT(*) as total_assets"]
+        grouping_sets = []
+        seen_gids = set()
+        layout = {}
+        
+        for position, (name, keys) in enumerate(distribution_keys.items()):
+            # Unowned is judged on the first field of each distribution
+            first = keys[0]
+            select_parts.append(f"COUNT(*) FILTER (WHERE v{first} IS NULL OR v{first} = '') as u{position}")
+            # GROUPING() sets a bit for every key column not in the grouping set
+            gid = sum(1 << (key_count - 1 - i) for i in range(key_count) if i not in keys)
+            # Distributions over the same key columns share one grouping set (and
+            # gid); emitting it twice would make DuckDB return its rows twice
+            if gid not in seen_gids:
+                seen_gids.add(gid)
+                grouping_sets.append(f"({', '.join(f'k{i}' for i in sorted(set(keys)))})")
+            layout[name] = (gid, [1 + i for i in keys], 1 + key_count, 2 + key_count + position)
+        
+        row_source = self._row_source(table_name, ', '.join(row_columns))
+        query = f"""
+            SELECT {', '.join(select_parts)}
+            FROM ({row_source})
+            GROUP BY GROUPING SETS ({', '.join(grouping_sets)})
+        """
+        return query, layout
+    
+    def get_all_distributions(self, table_name: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the parent cloud, cloud, team, MBU and BU distributions in one query.
+        
+        All distributions are aggregated together with GROUPING SETS over a single
+        scan; results of the combined query are cached for the reader session per
+        table_name, so the individual get_*_distribution calls of a dashboard share
+        one query.
         
         Args:
             table_name: Optional specific table to query. If None, queries all tables.
         
         Returns:
-            List of dictionaries containing parent_cloud, total_assets, and unowned_assets
+            Dictionary mapping 'parent_cloud', 'cloud', 'team', 'mbu' and 'bu' to
+            their distribution rows, each sorted by total_assets descending; a
+            fresh copy on every call
             
         Raises:
             ValueError: If reader is not initialized
@@ -451,19 +742,74 @@ class OwnerAnalyser(AssetAnalyser):
         if not self.reader:
             raise ValueError("Reader not initialized. Call create_reader() first.")
         
+        self._check_metadata_cache()
+        cache_key = ('distributions', table_name)
+        if cache_key in self._result_cache:
+            return self._copy_distributions(self._result_cache[cache_key])
+        
+        distributions = {name: [] for name in self.DISTRIBUTIONS}
         try:
-            _, _, available_columns = self._get_table_and_columns(table_name)
-            parent_cloud_field = self._find_field(available_columns, ['parentcloud.name', 'parent_cloud'])
-            
-            if not parent_cloud_field:
-                return []
-            
-            distribution_query = self._build_distribution_query(table_name, parent_cloud_field, 'parent_cloud')
-            return self.reader.execute_query(distribution_query)
+            fields = self._get_distribution_fields(table_name)
+            if not fields:
+                return distributions
+            
+            query, layout = self._build_all_distributions_query(table_name, fields)
+            rows = self.reader.execute_query(query, as_tuples=True)
+            
+            if rows:
+                outputs = {name: [fc['output'] for fc in fields_config] for name, fields_config in fields.items()}
+                by_gid = {}
+                for name in layout:
+                    by_gid.setdefault(layout[name][0], []).append(name)
+                for row in rows:
+                    for name in by_gid.get(row[0], ()):
+                        _, key_columns, total_column, unowned_column = layout[name]
+                        entry = {output: row[key] for output, key in zip(outputs[name], key_columns)}
+                        entry['total_assets'] = row[total_column]
+                        entry['unowned_assets'] = row[unowned_column]
+                        distributions[name].append(entry)
+                for name in distributions:
+                    distributions[name].sort(key=lambda entry: entry['total_assets'], reverse=True)
+            else:
+                # Empty data or a failed combined query (e.g. malformed JSON in one
+                # field); query each distribution separately so one can't sink the rest.
+                # The reader returns [] for a failed query too, so these results are
+                # not cached: a later call retries instead of serving the failure.
+                for name, fields_config in fields.items():
+                    distributions[name] = self.reader.execute_query(
+                        self._build_multi_field_distribution_query(table_name, fields_config)
+                    )
+                return distributions
             
         except Exception as e:
-            print(f"⚠️ Parent cloud distribution query failed: {e}")
-            return []
+            logger.warning("Distribution query failed: %s", e)
+            return distributions
+        
+        self._result_cache[cache_key] = distributions
+        return self._copy_distributions(distributions)
+    
+    @staticmethod
+    def _copy_distributions(distributions: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Copy cached distributions down to the rows so callers can't modify the cache."""
+        return {name: [dict(row) for row in rows] for name, rows in distributions.items()}
+    
+    def get_parent_cloud_distribution(self, table_name: str = None) -> List[Dict[str, Any]]:
+        """
+        Get ownership distribution by parent cloud using DuckDB SQL query.
+        
+        Args:
+            table_name: Optional specific table to query. If None, queries all tables.
+        
+        Returns:
+            List of dictionaries containing parent_cloud, total_assets, and unowned_assets
+            
+        Raises:
+            ValueError: If reader is not initialized
+        """
+        if not self.reader:
+            raise ValueError("Reader not initialized. Call create_reader() first.")
+        
+        return self.get_all_distributions(table_name)['parent_cloud']
     
     def get_cloud_distribution(self, table_name: str = None) -> List[Dict[str, Any]]:
         """
@@ -481,18 +827,7 @@ class OwnerAnalyser(AssetAnalyser):
         if not self.reader:
             raise ValueError("Reader not initialized. Call create_reader() first.")
         
-        try:
-            _, _, available_columns = self._get_table_and_columns(table_name)
-            cloud_field = self._find_field(available_columns, ['cloud.name', 'cloud'])
-            
-            if not cloud_field:
-                return []
-            
-            distribution_query = self._build_distribution_query(table_name, cloud_field, 'cloud')
-            return self.reader.execute_query(distribution_query)
-            
-        except Exception as e:
-            return []
+        return self.get_all_distributions(table_name)['cloud']
     
     def get_team_distribution(self, table_name: str = None) -> List[Dict[str, Any]]:
         """
@@ -510,18 +845,7 @@ class OwnerAnalyser(AssetAnalyser):
         if not self.reader:
             raise ValueError("Reader not initialized. Call create_reader() first.")
         
-        try:
-            _, _, available_columns = self._get_table_and_columns(table_name)
-            team_field = self._find_field(available_columns, ['team.name', 'team'])
-            
-            if not team_field:
-                return []
-            
-            distribution_query = self._build_distribution_query(table_name, team_field, 'team')
-            return self.reader.execute_query(distribution_query)
-            
-        except Exception as e:
-            return []
+        return self.get_all_distributions(table_name)['team']
     
     def get_mbu_distribution(self, table_name: str = None) -> List[Dict[str, Any]]:
         """
@@ -539,30 +863,7 @@ class OwnerAnalyser(AssetAnalyser):
         if not self.reader:
             return None
         
-        try:
-            _, _, available_columns = self._get_table_and_columns(table_name)
-            
-            # Find MBU field
-            mbu_field = self._find_field(available_columns, ['properties_mbu', 'mbu', 'properties.mbu'])
-            if not mbu_field:
-                # Fallback: look for any properties field
-                mbu_field = self._find_field(available_columns, ['properties'])
-            if not mbu_field:
-                return []
-            
-            # Check if JSON field
-            is_json = self._is_json_field(table_name, mbu_field)
-            
-            # Build and execute query
-            distribution_query = self._build_distribution_query(
-                table_name, mbu_field, 'mbu',
-                is_json=is_json, json_path='$.mbu'
-            )
-            return self.reader.execute_query(distribution_query)
-            
-        except Exception as e:
-            print(f"⚠️ MBU distribution query failed: {e}")
-            return []
+        return self.get_all_distributions(table_name)['mbu']
     
     def get_bu_distribution(self, table_name: str = None) -> List[Dict[str, Any]]:
         """
@@ -580,33 +881,4 @@ class OwnerAnalyser(AssetAnalyser):
         if not self.reader:
             raise ValueError("Reader not initialized. Call create_reader() first.")
         
-        try:
-            _, _, available_columns = self._get_table_and_columns(table_name)
-            
-            # Find BU and MBU fields
-            bu_field = self._find_field(available_columns, ['properties_bu', 'bu', 'properties.bu', 'business_unit'])
-            if not bu_field:
-                bu_field = self._find_field(available_columns, ['properties'])
-            if not bu_field:
-                return []
-            
-            mbu_field = self._find_field(available_columns, ['properties_mbu', 'mbu', 'properties.mbu'])
-            if not mbu_field:
-                mbu_field = bu_field  # Use same field for MBU
-            
-            # Check if JSON fields
-            bu_is_json = self._is_json_field(table_name, bu_field)
-            mbu_is_json = self._is_json_field(table_name, mbu_field)
-            
-            # Build fields config
-            fields_config = [
-                {'field': bu_field, 'output': 'bu', 'is_json': bu_is_json, 'json_path': '$.bu'},
-                {'field': mbu_field, 'output': 'mbu', 'is_json': mbu_is_json, 'json_path': '$.mbu'}
-            ]
-            
-            # Build and execute query
-            distribution_query = self._build_multi_field_distribution_query(table_name, fields_config)
-            return self.reader.execute_query(distribution_query)
-            
-        except Exception as e:
-            return []
+        return self.get_all_distributions(table_name)['bu']
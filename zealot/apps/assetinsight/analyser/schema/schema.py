@@ -2,6 +2,8 @@
 Schema Analyser - Database schema analysis and metadata exploration.
 """
 
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 from ..base import Analyser
 
@@ -13,6 +15,26 @@ class SchemaAnalyser(Analyser):
     
     def __init__(self):
         super().__init__("schema")
+        self._source_directory = None
+    
+    def create_reader(self, source_directory: str) -> None:
+        """Create a database reader and remember which directory it serves."""
+        super().create_reader(source_directory)
+        self._source_directory = source_directory
+    
+    def _get_reader(self, source_directory: str):
+        """
+        Get a reader for source_directory, reusing the current one when possible.
+        
+        Args:
+            source_directory: Path to source directory containing database
+            
+        Returns:
+            Database reader
+        """
+        if self.reader is None or self._source_directory != source_directory:
+            self.create_reader(source_directory)
+        return self.reader
     
     def analyse(self, source_directory: str, result_directory: str) -> Dict[str, Any]:
         """
@@ -33,24 +55,25 @@ class SchemaAnalyser(Analyser):
             tables_result = self.execute_query("SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'")
             tables = [row['table_name'] for row in tables_result] if tables_result else []
             
-            # Get table metadata for each table
-            table_metadata = {}
-            for table_name in tables:
-                metadata_query = f"""
-                    SELECT 
-                        column_name,
-                        data_type,
-                        is_nullable,
-                        column_default,
-                        ordinal_position
-                    FROM information_schema.columns 
-                    WHERE table_name = '{table_name}' 
-                    AND table_schema = 'main'
-                    ORDER BY ordinal_position
-                """
-                
-                metadata_result = self.execute_query(metadata_query)
-                table_metadata[table_name] = metadata_result if metadata_result else []
+            # Read the columns of every table in one query and group them per table
+            columns_result = self.execute_query("""
+                SELECT 
+                    table_name,
+                    column_name,
+                    data_type,
+                    is_nullable,
+                    column_default,
+                    ordinal_position
+                FROM information_schema.columns 
+                WHERE table_schema = 'main'
+                ORDER BY table_name, ordinal_position
+            """)
+            table_metadata = {table_name: [] for table_name in tables}
+            for table_name, rows in groupby(columns_result or [], key=itemgetter('table_name')):
+                if table_name in table_metadata:
+                    table_metadata[table_name] = [
+                        {key: value for key, value in row.items() if key != 'table_name'} for row in rows
+                    ]
             
             return {
                 'success': True,
@@ -84,9 +107,7 @@ class SchemaAnalyser(Analyser):
             List of table names
         """
         try:
-            # Use factory to create reader
-            from database.duckdb import DatabaseFactory, DatabaseType
-            reader = DatabaseFactory.create_reader(DatabaseType.SONIC, source_directory)
+            reader = self._get_reader(source_directory)
             tables_result = reader.execute_query("SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'")
             tables = [row['table_name'] for row in tables_result] if tables_result else []
             
@@ -108,11 +129,9 @@ class SchemaAnalyser(Analyser):
             List of column metadata dictionaries
         """
         try:
-            # Use factory to create reader
-            from database.duckdb import DatabaseFactory, DatabaseType
-            reader = DatabaseFactory.create_reader(DatabaseType.SONIC, source_directory)
+            reader = self._get_reader(source_directory)
             
-            metadata_query = f"""
+            metadata_query = """
                 SELECT 
                     column_name,
                     data_type,
@@ -120,12 +139,13 @@ class SchemaAnalyser(Analyser):
                     column_default,
                     ordinal_position
                 FROM information_schema.columns 
-                WHERE table_name = '{table_name}' 
+                WHERE table_name = ? 
                 AND table_schema = 'main'
                 ORDER BY ordinal_position
             """
             
-            metadata_result = reader.execute_query(metadata_query)
+            # Bind the table name so every table shares one query text
+            metadata_result = reader.execute_query(metadata_query, parameters=[table_name])
             
             return metadata_result if metadata_result else []
             
@@ -146,9 +166,7 @@ class SchemaAnalyser(Analyser):
             List of sample records
         """
         try:
-            # Use factory to create reader
-            from database.duckdb import DatabaseFactory, DatabaseType
-            reader = DatabaseFactory.create_reader(DatabaseType.SONIC, source_directory)
+            reader = self._get_reader(source_directory)
             
             sample_query = f"SELECT * FROM \"{table_name}\" LIMIT {limit}"
             sample_data = reader.execute_query(sample_query)
@@ -6,6 +6,7 @@ and processed by the AssetInsight system.
 """
 
 from enum import Enum
+from typing import Optional
 
 
 class AssetClass(Enum):
@@ -82,10 +83,23 @@ class AssetClass(Enum):
         Raises:
             ValueError: If the value is not a valid asset class
         """
-        for asset_class in cls:
-            if asset_class.value[0] == value:
-                return asset_class
-        raise ValueError(f"Invalid asset class: {value}")
+        asset_class = _CLASS_BY_NAME.get(value)
+        if asset_class is None:
+            raise ValueError(f"Invalid asset class: {value}")
+        return asset_class
+    
+    @classmethod
+    def get_table_name(cls, value: str) -> Optional[str]:
+        """
+        Get the database table name for an asset class name.
+        
+        Args:
+            value: String representation of the asset class
+            
+        Returns:
+            The table name, or None if the value is not a valid asset class
+        """
+        return _CLASS_NAME_TO_TABLE.get(value)
     
     @classmethod
     def get_all_values(cls) -> list[str]:
@@ -135,7 +149,7 @@ class AssetClass(Enum):
         Returns:
             List of all table names
         """
-        return list(set(asset_class.table_name for asset_class in cls))
+        return list(_ALL_TABLE_NAMES)
     
     @classmethod
     def get_asset_classes_for_table(cls, table_name: str) -> list[str]:
@@ -149,3 +163,9 @@ class AssetClass(Enum):
             List of asset class names that map to the table
         """
         return [asset_class.class_name for asset_class in cls if asset_class.table_name == table_name]
+
+
+# Lookups built once at import; the enum is immutable
+_CLASS_BY_NAME = {asset_class.value[0]: asset_class for asset_class in AssetClass}
+_CLASS_NAME_TO_TABLE = {asset_class.class_name: asset_class.table_name for asset_class in AssetClass}
+_ALL_TABLE_NAMES = tuple(set(asset_class.table_name for asset_class in AssetClass))
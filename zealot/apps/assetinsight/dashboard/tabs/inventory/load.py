@@ -170,7 +170,7 @@ class LoadTab(BaseTab):
                     try:
                         tables_result = reader.conn.execute("SHOW TABLES").fetchall()
                         actual_table_names = [table[0] for table in tables_result] if tables_result else []
-                    except:
+                    except Exception:
                         actual_table_names = []
                 else:
                     actual_table_names = []
@@ -3,7 +3,7 @@ Minimal Reader interface for SQL operations
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
 from pathlib import Path
 import json
 from configreader import SchemaGuide
@@ -175,8 +175,9 @@ class Reader(ABC):
             raise e
     
     @abstractmethod
-    def execute_query(self, sql_query: str) -> List[Dict[str, Any]]:
-        """Execute SQL query and return results"""
+    def execute_query(self, sql_query: str, as_tuples: bool = False,
+                      parameters: Optional[Sequence[Any]] = None) -> List[Any]:
+        """Execute SQL query and return results (dict rows, or tuples when as_tuples is True)"""
         pass
     
     @abstractmethod
@@ -5,7 +5,7 @@ Minimal DuckDB Reader - Singleton Pattern
 import json
 import duckdb
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
 import tempfile
 import os
 from ..base import Reader
@@ -58,7 +58,8 @@ class BasicMemoryDuckdb(Reader):
     
     def _load_json_files(self):
         """Load JSON files into DuckDB"""
-        json_files = list(self.folder_path.glob("*.json"))
+        with os.scandir(self.folder_path) as entries:
+            json_files = [Path(entry.path) for entry in entries if entry.name.endswith('.json') and entry.is_file()]
         if not json_files:
             print("⚠️ No JSON files found in directory")
             return
@@ -71,7 +72,61 @@ class BasicMemoryDuckdb(Reader):
         # Create table using SchemaGuide
         self._create_assets_table(self.conn)
         
-        # Load files with progress tracking
+        # Let DuckDB scan and insert every file in one statement; fall back to
+        # per-file Python loading if the scan fails (e.g. a non-array file)
+        try:
+            total_assets = self._load_json_files_native(json_files)
+        except Exception as e:
+            print(f"⚠️ DuckDB JSON scan failed, falling back to per-file loading: {e}")
+            self.conn.execute("DELETE FROM assets")
+            total_assets = self._load_json_files_python(json_files)
+        
+        print(f"✅ Load Complete: {total_assets:,} total assets loaded from {len(json_files)} files")
+    
+    def _load_json_files_native(self, json_files: List[Path]) -> int:
+        """Load JSON files with DuckDB's JSON reader and return asset count"""
+        table_schema = self._get_schema()
+        column_names = []
+        select_exprs = []
+        for col in table_schema['columns']:
+            col_name = col['column_name']
+            col_type = col['data_type']
+            
+            if col_type == 'JSON':
+                if col_name == 'properties':
+                    expr = self._nested_json_sql('properties_')
+                elif col_name == 'tags':
+                    expr = self._nested_json_sql('tags_')
+                elif col_name == 'raw_data':
+                    expr = "j"
+                else:
+                    expr = f"COALESCE(j -> '{col_name}', '{{}}')"
+            else:
+                expr = f"j ->> '{col_name}'"
+            
+            column_names.append(col_name)
+            select_exprs.append(expr)
+        
+        insert_sql = f"""
+            INSERT INTO assets ({', '.join(column_names)})
+            SELECT {', '.join(select_exprs)}
+            FROM (SELECT json AS j FROM read_json_objects(?, format='array'))
+            WHERE json_type(j) = 'OBJECT'
+        """
+        self.conn.execute(insert_sql, [[str(file_path) for file_path in json_files]])
+        return self.conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+    
+    @staticmethod
+    def _nested_json_sql(prefix: str) -> str:
+        """SQL equivalent of Reader._reconstruct_nested_json for a row bound as j"""
+        return (
+            f"(SELECT COALESCE(json_group_object(k[{len(prefix) + 1}:], j -> k), '{{}}') "
+            f"FROM unnest(json_keys(j)) AS t(k) "
+            f"WHERE starts_with(k, '{prefix}') AND COALESCE(j ->> k, '') <> '')"
+        )
+    
+    def _load_json_files_python(self, json_files: List[Path]) -> int:
+        """Load JSON files one by one in Python and return asset count"""
         total_assets = 0
         for i, file_path in enumerate(json_files, 1):
             file_assets = self._load_single_file(file_path)
@@ -81,7 +136,7 @@ class BasicMemoryDuckdb(Reader):
             progress = (i / len(json_files)) * 100
             print(f"📊 Progress: {progress:.1f}% ({i}/{len(json_files)}) - Loaded {file_assets} assets from {file_path.name}")
         
-        print(f"✅ Load Complete: {total_assets:,} total assets loaded from {len(json_files)} files")
+        return total_assets
     
     def _load_single_file(self, file_path: Path) -> int:
         """Load a single JSON file into DuckDB and return asset count"""
@@ -139,14 +194,23 @@ class BasicMemoryDuckdb(Reader):
         
         return asset_count
     
-    def execute_query(self, sql_query: str) -> List[Dict[str, Any]]:
-        """Execute a SQL query and return results"""
+    def execute_query(self, sql_query: str, as_tuples: bool = False,
+                      parameters: Optional[Sequence[Any]] = None) -> List[Any]:
+        """
+        Execute a SQL query and return results.
+        
+        Rows are dicts keyed by column name, or the raw result tuples when
+        as_tuples is True (no per-row dict construction). Values for ``?``
+        placeholders are bound from parameters.
+        """
         # Use the existing in-memory connection
         if not self.conn:
             return []
         
         try:
-            result = self.conn.execute(sql_query).fetchall()
+            result = self.conn.execute(sql_query, parameters).fetchall()
+            if as_tuples:
+                return result
             columns = [desc[0] for desc in self.conn.description]
             return [dict(zip(columns, row)) for row in result]
         except Exception as e:
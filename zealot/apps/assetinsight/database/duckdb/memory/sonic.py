@@ -109,12 +109,15 @@ class SonicMemoryDuckdb(BasicMemoryDuckdb):
     def _get_file_list_with_sizes(self) -> List[Tuple[Path, int]]:
         """Get list of JSON files with their sizes for better chunking."""
         files_with_sizes = []
-        for file_path in Path(self.folder_path).glob("*.json"):
-            try:
-                size = file_path.stat().st_size
-                files_with_sizes.append((file_path, size))
-            except OSError:
-                continue
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    if entry.is_file():
+                        files_with_sizes.append((Path(entry.path), entry.stat().st_size))
+                except OSError:
+                    continue
         return files_with_sizes
     
     def _should_use_streaming_mode(self, files_with_sizes: List[Tuple[Path, int]]) -> bool:
@@ -855,12 +858,8 @@ class SonicMemoryDuckdb(BasicMemoryDuckdb):
         try:
             asset_class_name = asset.get('assetClass', '')
             
-            # Find the asset class in the enum and get its table name
-            for asset_class in AssetClass:
-                if asset_class.class_name == asset_class_name:
-                    return asset_class.table_name
-            
-            return 'assets'
+            # Look up the asset class's table name in the enum
+            return AssetClass.get_table_name(asset_class_name) or 'assets'
                 
         except Exception:
             return 'assets'
@@ -1044,7 +1043,7 @@ class SonicMemoryDuckdb(BasicMemoryDuckdb):
                     continue
             
             stats['total_assets'] = total_assets
-        except:
+        except Exception:
             stats['total_assets'] = 0
         
         # Add timing stats
@@ -1060,7 +1059,7 @@ class SonicMemoryDuckdb(BasicMemoryDuckdb):
             memory_info = psutil.virtual_memory()
             stats['memory_usage_percent'] = memory_info.percent
             stats['available_memory_gb'] = memory_info.available / (1024**3)
-        except:
+        except Exception:
             stats['memory_usage_percent'] = 0
             stats['available_memory_gb'] = 0
         
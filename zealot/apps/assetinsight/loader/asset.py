@@ -6,13 +6,160 @@ designed for processing asset data and generating organized output files
 by parentCloud with team and asset aggregations.
 """
 
-import json
+import sys
+import orjson  # Faster JSON parsing
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from collections import defaultdict
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import cpu_count
 from zealot.utils.loader.json import JSONLoader
 
 
+def _parse_chunk(file_paths: List[str]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Parse a chunk of asset JSON files in a worker process.
+    
+    Args:
+        file_paths: List of JSON file paths to parse
+        
+    Returns:
+        (data, error) for each path, in order; data is None and error holds the
+        message for files that failed to load (both None for a missing file)
+    """
+    results = []
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'rb') as f:
+                results.append((orjson.loads(f.read()), None))
+        except FileNotFoundError:
+            results.append((None, None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+ZOMBIE_CLOUD_ID = "zombie_cloud"
+ZOMBIE_TEAM_ID = "zombie_team"
+
+# Serialized team entry for assets without any attributions
+_ZOMBIE_TEAM_KEY = orjson.dumps({
+    'externalId': ZOMBIE_TEAM_ID,
+    'name': 'Zombie Team',
+    'type': 'zombie_team',
+    'status': 'unknown',
+    'lead': {},
+    'cloud': {
+        'externalId': ZOMBIE_CLOUD_ID,
+        'name': 'Zombie Cloud',
+        'type': 'zombie_cloud'
+    }
+}, option=orjson.OPT_SORT_KEYS)
+
+
+class _SafeFilenameTable(dict):
+    """str.translate table keeping alphanumerics, spaces, '-' and '_' (filled in per code point on first use)."""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
+def _intern(value: Any) -> Any:
+    """Intern string IDs/names so repeated values across assets share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _dump_summary(f: BinaryIO, summary: Dict[str, Any]) -> None:
+    """
+    Stream a parent cloud summary to f as indented JSON.
+    
+    List values (cloud_assets, team_assets) are serialized one entry at a time,
+    so the whole document never exists as a single bytes object. The output is
+    byte-identical to orjson.dumps(summary, option=OPT_INDENT_2 | OPT_NON_STR_KEYS).
+    
+    Args:
+        f: Binary file object to write to
+        summary: Parent cloud summary from generate_parent_cloud_summary
+    """
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    if not summary:
+        f.write(b"{}")
+        return
+    
+    # Serialized JSON has no raw newlines inside strings, so nested values are
+    # re-indented by prefixing each line break with the enclosing indentation
+    f.write(b"{")
+    for i, (key, value) in enumerate(summary.items()):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(orjson.dumps(key) + b": ")
+        if isinstance(value, list) and value:
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b",\n    " if j else b"\n    ")
+                f.write(orjson.dumps(item, option=option).replace(b"\n", b"\n    "))
+            f.write(b"\n  ]")
+        else:
+            f.write(orjson.dumps(value, option=option).replace(b"\n", b"\n  "))
+    f.write(b"\n}")
+
+
+def _write_cloud_file(summary: Dict[str, Any], output_path: Path) -> Path:
+    """
+    Write one parent cloud summary to a JSON file named after the cloud.
+    
+    Args:
+        summary: Parent cloud summary from generate_parent_cloud_summary
+        output_path: Directory to write the file into
+        
+    Returns:
+        Path of the created file
+    """
+    cloud_name = summary['cloud']['name']
+    cloud_id = summary['cloud']['externalId']
+    
+    # Create safe filename
+    safe_name = cloud_name.translate(_SAFE_FILENAME_TABLE).rstrip().replace(' ', '_')
+    file_path = output_path / f"{safe_name}_{cloud_id}.json"
+    
+    with open(file_path, 'wb', buffering=1 << 20) as f:
+        _dump_summary(f, summary)
+    
+    return file_path
+
+
+@lru_cache(maxsize=32)
+def _compile_simplifier(fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function that extracts a fixed set of top-level fields from an asset.
+    
+    The field list and the properties default are resolved once here rather
+    than on every asset, and the result is cached per field tuple so loaders
+    sharing a field set share one simplifier.
+    
+    Args:
+        fields: Names of the asset fields to keep, in output order
+        
+    Returns:
+        Function mapping raw asset data to its simplified form
+    """
+    field_tuple = tuple(fields)
+    want_properties = 'properties' in field_tuple
+    
+    def simplify(asset_data: Dict[str, Any]) -> Dict[str, Any]:
+        simplified = {field: asset_data.get(field) for field in field_tuple}
+        if want_properties and 'properties' not in asset_data:
+            simplified['properties'] = {}
+        return simplified
+    
+    return simplify
+
+
 class AssetDataLoader(JSONLoader):
     """
     Specialized JSON loader for asset management data.
@@ -28,18 +175,150 @@ class AssetDataLoader(JSONLoader):
     - Real-time processing statistics
     """
     
-    def __init__(self, json_folder: Union[str, Path] = None):
+    # Upper bound on files read ahead of the consumer (keeps FD/memory use bounded)
+    MAX_INFLIGHT_FILES = 512
+    # Average file size above which parsing is CPU-bound enough to shard across processes
+    PROCESS_POOL_MIN_AVG_FILE_SIZE = 64 * 1024
+    # Number of files whose sizes are sampled to estimate the average
+    PROCESS_POOL_SAMPLE_FILES = 64
+    # Number of files handed to a worker process per task
+    PARSE_CHUNK_SIZE = 50
+    # Fields an asset must carry to be considered valid
+    REQUIRED_FIELDS = ('id', 'name', 'assetClass', 'organization', 'status')
+    # Fields kept for each asset in the team assets mapping
+    SIMPLIFIED_ASSET_FIELDS = (
+        'id', 'name', 'identifier', 'assetClass', 'status',
+        'organization', 'properties', 'lastSeenDate', 'createdDate'
+    )
+    
+    def __init__(self, json_folder: Union[str, Path] = None, max_workers: int = None):
         """
         Initialize the Asset Data loader.
         
         Args:
             json_folder: Path to the folder containing asset JSON files.
+            max_workers: Maximum number of threads or processes used to load files
+                         (default: min(cpu_count, 16))
         """
         if json_folder is None:
             # Default to current directory
             json_folder = Path.cwd()
         
-        super().__init__(json_folder, recursive=False)
+        super().__init__(json_folder)
+        self.max_workers = max_workers or min(cpu_count(), 16)
+        self._simplify_asset = _compile_simplifier(tuple(self.SIMPLIFIED_ASSET_FIELDS))
+    
+    def _load_file(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a specific asset JSON file from disk using orjson.
+        
+        Args:
+            filename: Name of the file without extension
+            
+        Returns:
+            The JSON data or None if file not found/error
+        """
+        file_path = self.json_folder / f"{filename}.json"
+        if not file_path.exists():
+            return None
+        
+        try:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+    
+    def _iter_file_data(self) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Yield (filename, data) pairs in file order, loading files concurrently.
+        
+        Small files are I/O-bound and are read on a thread pool; when the average
+        file size is large, parsing dominates and files are parsed across
+        processes instead.
+        
+        Yields:
+            Tuple of (filename, asset data or None if the file could not be read
+            or is not a well-formed asset)
+        """
+        files = self.list_files()
+        if self._should_use_process_pool(files):
+            file_data = self._iter_file_data_multiprocess(files)
+        else:
+            file_data = self._iter_file_data_threaded(files)
+        
+        # Reject malformed assets up front so the grouping loops need no guards
+        for filename, data in file_data:
+            yield filename, data if self._is_well_formed(data) else None
+    
+    @staticmethod
+    def _is_well_formed(data: Any) -> bool:
+        """Check that data is an asset dict whose attributions (if any) are a list."""
+        return isinstance(data, dict) and isinstance(data.get('assetAttributions', []), list)
+    
+    def _should_use_process_pool(self, files: List[str]) -> bool:
+        """Determine if files are large enough on average to parse in worker processes (sampled)."""
+        sample = files[:self.PROCESS_POOL_SAMPLE_FILES]
+        if not sample:
+            return False
+        
+        total_size = 0
+        for filename in sample:
+            try:
+                total_size += (self.json_folder / f"{filename}.json").stat().st_size
+            except OSError:
+                continue
+        return total_size / len(sample) > self.PROCESS_POOL_MIN_AVG_FILE_SIZE
+    
+    def _iter_file_data_threaded(self, files: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Read files on a thread pool (file I/O releases the GIL).
+        
+        At most MAX_INFLIGHT_FILES results are held ahead of the consumer, so the
+        file-by-file memory profile is preserved.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for filename in files:
+                pending.append((filename, executor.submit(self.get_file_data, filename)))
+                if len(pending) >= self.MAX_INFLIGHT_FILES:
+                    name, future = pending.popleft()
+                    yield name, future.result()
+            
+            while pending:
+                name, future = pending.popleft()
+                yield name, future.result()
+    
+    def _iter_file_data_multiprocess(self, files: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Parse files in chunks on a process pool, bypassing the GIL for JSON decoding.
+        
+        At most two chunks per worker are in flight ahead of the consumer, so
+        workers can't parse the whole directory into memory before it is used.
+        """
+        max_inflight_chunks = self.max_workers * 2
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for i in range(0, len(files), self.PARSE_CHUNK_SIZE):
+                chunk = files[i:i + self.PARSE_CHUNK_SIZE]
+                paths = [str(self.json_folder / f"{filename}.json") for filename in chunk]
+                pending.append((chunk, executor.submit(_parse_chunk, paths)))
+                if len(pending) >= max_inflight_chunks:
+                    chunk, future = pending.popleft()
+                    yield from self._report_chunk_errors(chunk, future.result())
+            
+            while pending:
+                chunk, future = pending.popleft()
+                yield from self._report_chunk_errors(chunk, future.result())
+    
+    def _report_chunk_errors(self, chunk: List[str],
+                             chunk_results: List[Tuple[Optional[Dict[str, Any]], Optional[str]]]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Yield (filename, data) for a parsed chunk, reporting load errors like _load_file."""
+        for filename, (data, error) in zip(chunk, chunk_results):
+            if error is not None:
+                print(f"Error loading {self.json_folder / f'{filename}.json'}: {error}")
+            yield filename, data
     
     def process_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,13 +331,15 @@ class AssetDataLoader(JSONLoader):
             Processed asset data with additional computed fields
         """
         processed = data.copy()
+        attributions = data.get('assetAttributions', [])
+        parent_cloud = self._first_parent_cloud(attributions)
         
         # Add computed fields
         processed['_is_valid'] = self._validate_asset_data(data)
-        processed['_parent_cloud_id'] = self._extract_parent_cloud_id(data)
-        processed['_parent_cloud_name'] = self._extract_parent_cloud_name(data)
+        processed['_parent_cloud_id'] = _intern(parent_cloud.get('externalId')) if parent_cloud else None
+        processed['_parent_cloud_name'] = _intern(parent_cloud.get('name')) if parent_cloud else None
         processed['_team_count'] = self._count_teams(data)
-        processed['_has_attributions'] = len(data.get('assetAttributions', [])) > 0
+        processed['_has_attributions'] = len(attributions) > 0
         
         return processed
     
@@ -72,26 +353,64 @@ class AssetDataLoader(JSONLoader):
         Returns:
             True if asset data is valid, False otherwise
         """
-        required_fields = ['id', 'name', 'assetClass', 'organization', 'status']
-        return all(field in data for field in required_fields)
+        return all(field in data for field in self.REQUIRED_FIELDS)
     
-    def _extract_parent_cloud_id(self, data: Dict[str, Any]) -> Optional[str]:
-        """Extract parent cloud ID from asset attributions."""
-        attributions = data.get('assetAttributions', [])
+    def _first_parent_cloud(self, attributions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the first non-empty parent cloud in asset attributions."""
         for attribution in attributions:
             parent_cloud = attribution.get('parentCloud')
             if parent_cloud:
-                return parent_cloud.get('externalId')
+                return parent_cloud
         return None
     
-    def _extract_parent_cloud_name(self, data: Dict[str, Any]) -> Optional[str]:
-        """Extract parent cloud name from asset attributions."""
-        attributions = data.get('assetAttributions', [])
+    def _extract_parent_cloud_id(self, data: Dict[str, Any]) -> Optional[str]:
+        """Extract parent cloud ID from asset attributions."""
+        parent_cloud = self._first_parent_cloud(data.get('assetAttributions', []))
+        return parent_cloud.get('externalId') if parent_cloud else None
+    
+    def _extract_attributions(self, attributions: List[Dict[str, Any]]) -> List[Tuple[str, str, Optional[bytes]]]:
+        """
+        Resolve asset attributions to (parent cloud ID, team ID, team key) entries.
+        
+        The team key is the serialized team data used to de-duplicate teams per
+        parent cloud, or None when the attribution has no team. Attributions
+        without a parent cloud or team fall back to the Zombie cloud/team, and
+        an asset without attributions resolves to a single Zombie team entry.
+        
+        Args:
+            attributions: The asset's assetAttributions list
+            
+        Returns:
+            One entry per attribution
+        """
+        if not attributions:
+            return [(ZOMBIE_CLOUD_ID, ZOMBIE_TEAM_ID, _ZOMBIE_TEAM_KEY)]
+        
+        entries = []
         for attribution in attributions:
             parent_cloud = attribution.get('parentCloud')
-            if parent_cloud:
-                return parent_cloud.get('name')
-        return None
+            team = attribution.get('team')
+            
+            if not team:
+                entries.append((ZOMBIE_CLOUD_ID, ZOMBIE_TEAM_ID, None))
+                continue
+            
+            pc_id = _intern(parent_cloud.get('externalId')) if parent_cloud else ZOMBIE_CLOUD_ID
+            team_id = _intern(team.get('externalId'))
+            team_data = {
+                'externalId': team_id,
+                'name': team.get('name'),
+                'type': team.get('type'),
+                'status': team.get('status'),
+                'lead': team.get('lead', {}),
+                'cloud': {
+                    'externalId': pc_id,
+                    'name': parent_cloud.get('name', 'Zombie Cloud') if parent_cloud else 'Zombie Cloud',
+                    'type': parent_cloud.get('type', 'zombie_cloud') if parent_cloud else 'zombie_cloud'
+                }
+            }
+            entries.append((pc_id, team_id, orjson.dumps(team_data, option=orjson.OPT_SORT_KEYS)))
+        return entries
     
     def _count_teams(self, data: Dict[str, Any]) -> int:
         """Count unique teams in asset attributions."""
@@ -112,12 +431,10 @@ class AssetDataLoader(JSONLoader):
         Returns:
             Dictionary mapping parent cloud ID to list of assets
         """
-        parent_cloud_assets = defaultdict(list)
-        ZOMBIE_CLOUD_ID = "zombie_cloud"
+        parent_cloud_assets = {}
         
         # Process files one by one instead of loading all into memory
-        for filename in self.list_files():
-            asset_data = self.get_file_data(filename)
+        for _, asset_data in self._iter_file_data():
             if asset_data:
                 processed_data = self.process_data(asset_data)
                 if processed_data and processed_data.get('_is_valid', False):
@@ -130,9 +447,9 @@ class AssetDataLoader(JSONLoader):
                         processed_data['_parent_cloud_id'] = ZOMBIE_CLOUD_ID
                         processed_data['_parent_cloud_name'] = "Zombie Cloud"
                     
-                    parent_cloud_assets[parent_cloud_id].append(processed_data)
+                    parent_cloud_assets.setdefault(parent_cloud_id, []).append(processed_data)
         
-        return dict(parent_cloud_assets)
+        return parent_cloud_assets
     
     def get_teams_by_parent_cloud(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -143,64 +460,19 @@ class AssetDataLoader(JSONLoader):
         Returns:
             Dictionary mapping parent cloud ID to list of unique teams
         """
-        parent_cloud_teams = defaultdict(set)
-        ZOMBIE_CLOUD_ID = "zombie_cloud"
+        parent_cloud_teams = {}
         
         # Process files one by one instead of loading all into memory
-        for filename in self.list_files():
-            asset_data = self.get_file_data(filename)
+        for _, asset_data in self._iter_file_data():
             if asset_data:
-                attributions = asset_data.get('assetAttributions', [])
-                
-                # Check if asset has any attributions with parent cloud
-                has_parent_cloud = any(attribution.get('parentCloud') for attribution in attributions)
-                
-                for attribution in attributions:
-                    parent_cloud = attribution.get('parentCloud')
-                    team = attribution.get('team')
-                    
-                    if team:
-                        # Determine parent cloud ID
-                        if parent_cloud:
-                            parent_cloud_id = parent_cloud.get('externalId')
-                        else:
-                            # If no parent cloud in this attribution, use Zombie cloud
-                            parent_cloud_id = ZOMBIE_CLOUD_ID
-                        
-                        team_data = {
-                            'externalId': team.get('externalId'),
-                            'name': team.get('name'),
-                            'type': team.get('type'),
-                            'status': team.get('status'),
-                            'lead': team.get('lead', {}),
-                            'cloud': {
-                                'externalId': parent_cloud_id,
-                                'name': parent_cloud.get('name', 'Zombie Cloud') if parent_cloud else 'Zombie Cloud',
-                                'type': parent_cloud.get('type', 'zombie_cloud') if parent_cloud else 'zombie_cloud'
-                            }
-                        }
-                        parent_cloud_teams[parent_cloud_id].add(json.dumps(team_data, sort_keys=True))
-                
-                # If asset has no attributions at all, create a default team for Zombie cloud
-                if not attributions:
-                    default_team_data = {
-                        'externalId': 'zombie_team',
-                        'name': 'Zombie Team',
-                        'type': 'zombie_team',
-                        'status': 'unknown',
-                        'lead': {},
-                        'cloud': {
-                            'externalId': ZOMBIE_CLOUD_ID,
-                            'name': 'Zombie Cloud',
-                            'type': 'zombie_cloud'
-                        }
-                    }
-                    parent_cloud_teams[ZOMBIE_CLOUD_ID].add(json.dumps(default_team_data, sort_keys=True))
+                for pc_id, _, team_key in self._extract_attributions(asset_data.get('assetAttributions', [])):
+                    if team_key is not None:
+                        parent_cloud_teams.setdefault(pc_id, set()).add(team_key)
         
         # Convert sets back to lists of dictionaries
         result = {}
         for parent_cloud_id, team_set in parent_cloud_teams.items():
-            result[parent_cloud_id] = [json.loads(team_json) for team_json in team_set]
+            result[parent_cloud_id] = [orjson.loads(team_json) for team_json in team_set]
         
         return result
     
@@ -213,54 +485,96 @@ class AssetDataLoader(JSONLoader):
         Returns:
             Nested dictionary: parent_cloud_id -> team_id -> list of assets
         """
-        team_assets_mapping = defaultdict(lambda: defaultdict(list))
-        ZOMBIE_CLOUD_ID = "zombie_cloud"
-        ZOMBIE_TEAM_ID = "zombie_team"
+        team_assets_mapping = {}
         
         # Process files one by one instead of loading all into memory
-        for filename in self.list_files():
-            asset_data = self.get_file_data(filename)
+        for _, asset_data in self._iter_file_data():
             if asset_data:
-                attributions = asset_data.get('assetAttributions', [])
-                
                 # Create simplified asset data
-                simplified_asset = {
-                    'id': asset_data.get('id'),
-                    'name': asset_data.get('name'),
-                    'identifier': asset_data.get('identifier'),
-                    'assetClass': asset_data.get('assetClass'),
-                    'status': asset_data.get('status'),
-                    'organization': asset_data.get('organization'),
-                    'properties': asset_data.get('properties', {}),
-                    'lastSeenDate': asset_data.get('lastSeenDate'),
-                    'createdDate': asset_data.get('createdDate')
-                }
+                simplified_asset = self._simplify_asset(asset_data)
                 
-                if attributions:
-                    # Process each attribution
-                    for attribution in attributions:
-                        parent_cloud = attribution.get('parentCloud')
-                        team = attribution.get('team')
-                        
-                        # Determine parent cloud and team IDs
-                        if parent_cloud and team:
-                            parent_cloud_id = parent_cloud.get('externalId')
-                            team_id = team.get('externalId')
-                        elif team:
-                            # Team exists but no parent cloud - assign to Zombie cloud
-                            parent_cloud_id = ZOMBIE_CLOUD_ID
-                            team_id = team.get('externalId')
-                        else:
-                            # No team - assign to Zombie cloud and team
-                            parent_cloud_id = ZOMBIE_CLOUD_ID
-                            team_id = ZOMBIE_TEAM_ID
-                        
-                        team_assets_mapping[parent_cloud_id][team_id].append(simplified_asset)
-                else:
-                    # No attributions at all - assign to Zombie cloud and team
-                    team_assets_mapping[ZOMBIE_CLOUD_ID][ZOMBIE_TEAM_ID].append(simplified_asset)
-        
-        return dict(team_assets_mapping)
+                for pc_id, team_id, _ in self._extract_attributions(asset_data.get('assetAttributions', [])):
+                    team_assets_mapping.setdefault(pc_id, {}).setdefault(team_id, []).append(simplified_asset)
+        
+        return team_assets_mapping
+    
+    def _group_assets(self, counts_only: bool = False) -> Dict[str, Any]:
+        """
+        Group assets by parent cloud and team in a single pass over the files.
+        
+        Produces what get_assets_by_parent_cloud, get_teams_by_parent_cloud and
+        get_team_assets_mapping build, together with parent cloud details and
+        file counts, so each file is read and walked only once.
+        
+        Args:
+            counts_only: Only count assets per parent cloud and collect teams;
+                         skips copying assets and building the team assets mapping
+        
+        Returns:
+            Dictionary with parent_cloud_assets, parent_cloud_counts,
+            parent_cloud_teams (sets of serialized team data), team_assets_mapping,
+            cloud_details (parent cloud ID -> (name, type)), total_files and
+            valid_assets
+        """
+        parent_cloud_assets = {}
+        parent_cloud_counts = Counter()
+        parent_cloud_teams = {}
+        team_assets_mapping = {}
+        cloud_details = {}
+        total_files = 0
+        valid_assets = 0
+        
+        for _, asset_data in self._iter_file_data():
+            total_files += 1
+            if not asset_data:
+                continue
+            
+            attributions = asset_data.get('assetAttributions', [])
+            
+            # Parent cloud grouping (valid assets only)
+            if counts_only:
+                if self._validate_asset_data(asset_data):
+                    valid_assets += 1
+                    parent_cloud_counts[self._extract_parent_cloud_id(asset_data) or ZOMBIE_CLOUD_ID] += 1
+            else:
+                processed_data = self.process_data(asset_data)
+                if processed_data.get('_is_valid', False):
+                    valid_assets += 1
+                    parent_cloud_id = processed_data.get('_parent_cloud_id')
+                    
+                    if not parent_cloud_id:
+                        parent_cloud_id = ZOMBIE_CLOUD_ID
+                        processed_data['_parent_cloud_id'] = ZOMBIE_CLOUD_ID
+                        processed_data['_parent_cloud_name'] = "Zombie Cloud"
+                    elif not cloud_details.get(parent_cloud_id, (None,))[0]:
+                        # Take name/type from the first asset that names this parent cloud
+                        parent_cloud = self._first_parent_cloud(attributions)
+                        cloud_details[parent_cloud_id] = (
+                            parent_cloud.get('name'),
+                            parent_cloud.get('type', 'parent_cloud')
+                        )
+                    
+                    parent_cloud_assets.setdefault(parent_cloud_id, []).append(processed_data)
+                    parent_cloud_counts[parent_cloud_id] += 1
+            
+            # Team grouping and team assets mapping (all assets)
+            simplified_asset = None if counts_only else self._simplify_asset(asset_data)
+            
+            for pc_id, team_id, team_key in self._extract_attributions(attributions):
+                if team_key is not None:
+                    parent_cloud_teams.setdefault(pc_id, set()).add(team_key)
+                if not counts_only:
+                    team_assets_mapping.setdefault(pc_id, {}).setdefault(team_id, []).append(simplified_asset)
+        
+        return {
+            'parent_cloud_assets': parent_cloud_assets,
+            'parent_cloud_counts': parent_cloud_counts,
+            'parent_cloud_teams': parent_cloud_teams,
+            'team_assets_mapping': team_assets_mapping,
+            'cloud_details': cloud_details,
+            'total_files': total_files,
+            'valid_assets': valid_assets
+        }
     
     def generate_parent_cloud_summary(self) -> List[Dict[str, Any]]:
         """
@@ -270,38 +584,28 @@ class AssetDataLoader(JSONLoader):
         Returns:
             List of parent cloud summaries in the required format
         """
-        parent_cloud_assets = self.get_assets_by_parent_cloud()
-        parent_cloud_teams = self.get_teams_by_parent_cloud()
-        team_assets_mapping = self.get_team_assets_mapping()
+        grouped = self._group_assets()
+        parent_cloud_assets = grouped['parent_cloud_assets']
+        parent_cloud_teams = grouped['parent_cloud_teams']
+        team_assets_mapping = grouped['team_assets_mapping']
+        cloud_details = grouped['cloud_details']
         
         result = []
         
         for parent_cloud_id in parent_cloud_assets.keys():
             # Get parent cloud details
-            if parent_cloud_id == "zombie_cloud":
+            if parent_cloud_id == ZOMBIE_CLOUD_ID:
                 parent_cloud_name = "Zombie Cloud"
                 cloud_type = "zombie_cloud"
             else:
-                # Get parent cloud details from first asset
-                parent_cloud_name = None
-                cloud_type = "parent_cloud"
-                for asset in parent_cloud_assets[parent_cloud_id]:
-                    attributions = asset.get('assetAttributions', [])
-                    for attribution in attributions:
-                        parent_cloud = attribution.get('parentCloud')
-                        if parent_cloud and parent_cloud.get('externalId') == parent_cloud_id:
-                            parent_cloud_name = parent_cloud.get('name')
-                            cloud_type = parent_cloud.get('type', 'parent_cloud')
-                            break
-                    if parent_cloud_name:
-                        break
+                parent_cloud_name, cloud_type = cloud_details.get(parent_cloud_id, (None, "parent_cloud"))
                 
                 # Fallback if no name found
                 if not parent_cloud_name:
                     parent_cloud_name = f"Unknown Cloud ({parent_cloud_id})"
             
             # Get teams for this parent cloud
-            teams = parent_cloud_teams.get(parent_cloud_id, [])
+            teams = [orjson.loads(team_json) for team_json in parent_cloud_teams.get(parent_cloud_id, ())]
             team_assets = team_assets_mapping.get(parent_cloud_id, {})
             
             # Build team assets list
@@ -348,23 +652,18 @@ class AssetDataLoader(JSONLoader):
         output_path.mkdir(exist_ok=True)
         
         parent_cloud_summaries = self.generate_parent_cloud_summary()
-        created_files = []
-        
-        for summary in parent_cloud_summaries:
-            cloud_name = summary['cloud']['name']
-            cloud_id = summary['cloud']['externalId']
-            
-            # Create safe filename
-            safe_name = "".join(c for c in cloud_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_name = safe_name.replace(' ', '_')
-            filename = f"{safe_name}_{cloud_id}.json"
-            
-            file_path = output_path / filename
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
-            
-            created_files.append(file_path)
+        if not parent_cloud_summaries:
+            return []
+        
+        # Files are independent, so overlap the serialization and disk writes
+        max_workers = min(self.max_workers, len(parent_cloud_summaries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            created_files = list(executor.map(
+                lambda summary: _write_cloud_file(summary, output_path),
+                parent_cloud_summaries
+            ))
+        
+        for file_path in created_files:
             print(f"Created file: {file_path}")
         
         return created_files
@@ -378,36 +677,27 @@ class AssetDataLoader(JSONLoader):
         Returns:
             Dictionary with asset statistics
         """
-        total_assets = 0
-        valid_assets = 0
-        
-        # Process files one by one to count them
-        for filename in self.list_files():
-            total_assets += 1
-            asset_data = self.get_file_data(filename)
-            if asset_data:
-                processed_data = self.process_data(asset_data)
-                if processed_data and processed_data.get('_is_valid', False):
-                    valid_assets += 1
-        
-        parent_clouds = self.get_assets_by_parent_cloud()
-        teams = self.get_teams_by_parent_cloud()
+        grouped = self._group_assets(counts_only=True)
+        total_assets = grouped['total_files']
+        valid_assets = grouped['valid_assets']
+        parent_cloud_counts = grouped['parent_cloud_counts']
+        teams = grouped['parent_cloud_teams']
         
         # Calculate Zombie cloud statistics
-        zombie_assets = parent_clouds.get('zombie_cloud', [])
-        zombie_teams = teams.get('zombie_cloud', [])
+        zombie_assets_count = parent_cloud_counts.get(ZOMBIE_CLOUD_ID, 0)
+        zombie_teams = teams.get(ZOMBIE_CLOUD_ID, [])
         
         return {
             'total_files_loaded': total_assets,
             'valid_assets': valid_assets,
             'invalid_assets': total_assets - valid_assets,
-            'parent_clouds_count': len(parent_clouds),
+            'parent_clouds_count': len(parent_cloud_counts),
             'total_teams': sum(len(team_list) for team_list in teams.values()),
-            'assets_by_parent_cloud': {cloud_id: len(assets) for cloud_id, assets in parent_clouds.items()},
+            'assets_by_parent_cloud': dict(parent_cloud_counts),
             'zombie_cloud_stats': {
-                'zombie_assets_count': len(zombie_assets),
+                'zombie_assets_count': zombie_assets_count,
                 'zombie_teams_count': len(zombie_teams),
-                'zombie_assets_percentage': round((len(zombie_assets) / valid_assets * 100), 2) if valid_assets > 0 else 0
+                'zombie_assets_percentage': round((zombie_assets_count / valid_assets * 100), 2) if valid_assets > 0 else 0
             }
         }
     
@@ -426,16 +716,12 @@ class AssetDataLoader(JSONLoader):
         total_files = len(files)
         processed_count = 0
         valid_count = 0
-        parent_cloud_assets = defaultdict(list)
-        parent_cloud_teams = defaultdict(set)
-        team_assets_mapping = defaultdict(lambda: defaultdict(list))
+        parent_cloud_assets = {}
+        parent_cloud_teams = {}
+        team_assets_mapping = {}
         
-        ZOMBIE_CLOUD_ID = "zombie_cloud"
-        ZOMBIE_TEAM_ID = "zombie_team"
-        
-        for filename in files:
+        for filename, asset_data in self._iter_file_data():
             processed_count += 1
-            asset_data = self.get_file_data(filename)
             
             if asset_data:
                 processed_data = self.process_data(asset_data)
@@ -451,81 +737,15 @@ class AssetDataLoader(JSONLoader):
                         processed_data['_parent_cloud_id'] = ZOMBIE_CLOUD_ID
                         processed_data['_parent_cloud_name'] = "Zombie Cloud"
                     
-                    parent_cloud_assets[parent_cloud_id].append(processed_data)
-                    
-                    # Process for team grouping
-                    attributions = asset_data.get('assetAttributions', [])
-                    if attributions:
-                        for attribution in attributions:
-                            parent_cloud = attribution.get('parentCloud')
-                            team = attribution.get('team')
-                            
-                            if team:
-                                if parent_cloud:
-                                    pc_id = parent_cloud.get('externalId')
-                                else:
-                                    pc_id = ZOMBIE_CLOUD_ID
-                                
-                                team_data = {
-                                    'externalId': team.get('externalId'),
-                                    'name': team.get('name'),
-                                    'type': team.get('type'),
-                                    'status': team.get('status'),
-                                    'lead': team.get('lead', {}),
-                                    'cloud': {
-                                        'externalId': pc_id,
-                                        'name': parent_cloud.get('name', 'Zombie Cloud') if parent_cloud else 'Zombie Cloud',
-                                        'type': parent_cloud.get('type', 'zombie_cloud') if parent_cloud else 'zombie_cloud'
-                                    }
-                                }
-                                parent_cloud_teams[pc_id].add(json.dumps(team_data, sort_keys=True))
-                    else:
-                        # No attributions - create zombie team
-                        default_team_data = {
-                            'externalId': 'zombie_team',
-                            'name': 'Zombie Team',
-                            'type': 'zombie_team',
-                            'status': 'unknown',
-                            'lead': {},
-                            'cloud': {
-                                'externalId': ZOMBIE_CLOUD_ID,
-                                'name': 'Zombie Cloud',
-                                'type': 'zombie_cloud'
-                            }
-                        }
-                        parent_cloud_teams[ZOMBIE_CLOUD_ID].add(json.dumps(default_team_data, sort_keys=True))
+                    parent_cloud_assets.setdefault(parent_cloud_id, []).append(processed_data)
                     
-                    # Process for team assets mapping
-                    simplified_asset = {
-                        'id': asset_data.get('id'),
-                        'name': asset_data.get('name'),
-                        'identifier': asset_data.get('identifier'),
-                        'assetClass': asset_data.get('assetClass'),
-                        'status': asset_data.get('status'),
-                        'organization': asset_data.get('organization'),
-                        'properties': asset_data.get('properties', {}),
-                        'lastSeenDate': asset_data.get('lastSeenDate'),
-                        'createdDate': asset_data.get('createdDate')
-                    }
+                    # Process for team grouping and team assets mapping
+                    simplified_asset = self._simplify_asset(asset_data)
                     
-                    if attributions:
-                        for attribution in attributions:
-                            parent_cloud = attribution.get('parentCloud')
-                            team = attribution.get('team')
-                            
-                            if parent_cloud and team:
-                                pc_id = parent_cloud.get('externalId')
-                                team_id = team.get('externalId')
-                            elif team:
-                                pc_id = ZOMBIE_CLOUD_ID
-                                team_id = team.get('externalId')
-                            else:
-                                pc_id = ZOMBIE_CLOUD_ID
-                                team_id = ZOMBIE_TEAM_ID
-                            
-                            team_assets_mapping[pc_id][team_id].append(simplified_asset)
-                    else:
-                        team_assets_mapping[ZOMBIE_CLOUD_ID][ZOMBIE_TEAM_ID].append(simplified_asset)
+                    for pc_id, team_id, team_key in self._extract_attributions(asset_data.get('assetAttributions', [])):
+                        if team_key is not None:
+                            parent_cloud_teams.setdefault(pc_id, set()).add(team_key)
+                        team_assets_mapping.setdefault(pc_id, {}).setdefault(team_id, []).append(simplified_asset)
             
             # Call progress callback if provided
             if callback:
@@ -534,15 +754,15 @@ class AssetDataLoader(JSONLoader):
         # Convert team sets to lists
         teams_result = {}
         for pc_id, team_set in parent_cloud_teams.items():
-            teams_result[pc_id] = [json.loads(team_json) for team_json in team_set]
+            teams_result[pc_id] = [orjson.loads(team_json) for team_json in team_set]
         
         return {
             'total_files_processed': processed_count,
             'valid_assets': valid_count,
             'invalid_assets': processed_count - valid_count,
-            'parent_cloud_assets': dict(parent_cloud_assets),
+            'parent_cloud_assets': parent_cloud_assets,
             'parent_cloud_teams': teams_result,
-            'team_assets_mapping': dict(team_assets_mapping)
+            'team_assets_mapping': team_assets_mapping
         }
 
 
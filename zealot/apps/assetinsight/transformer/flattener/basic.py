@@ -6,6 +6,7 @@ for all flattening operations, ensuring consistency and eliminating code duplica
 """
 
 import json
+import orjson  # Faster JSON serialization
 from pathlib import Path
 from typing import Dict, List, Any
 from ..base import Transformer
@@ -136,8 +137,8 @@ class BasicFlattener(Transformer):
             flattened_assets, missing_attribution, missing_properties, missing_name, missing_parent_cloud = self._flatten_assets_with_analysis(assets)
             
             # Save flattened data
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(flattened_assets, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(flattened_assets, option=orjson.OPT_INDENT_2))
             
             return self.create_file_result(
                 success=True,
@@ -144,6 +144,7 @@ def _process_file_chunk(file_paths: List[str], target_dir: str) -> Dict[str, Any
     import warnings
     import logging
     import json
+    import orjson
     from pathlib import Path
     from ..utils.flattener_helper import FlattenerHelper
     
@@ -209,8 +210,8 @@ def _process_file_chunk(file_paths: List[str], target_dir: str) -> Dict[str, Any
                 flattened_assets.append(flattened_asset)
             
             # Save flattened data
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(flattened_assets, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(flattened_assets, option=orjson.OPT_INDENT_2))
             
             result = {
                 'success': True,
@@ -5,6 +5,13 @@ Flattener Helper - Utility functions for data flattening operations
 from typing import Dict, Any, Optional, List
 
 
+# Attribution entities as (source key, flattened column prefix)
+_OWNERSHIP_ENTITIES = (('parentCloud', 'parent_cloud'), ('cloud', 'cloud'), ('team', 'team'))
+
+# Top-level keys flatten_asset processes separately or drops
+_NESTED_KEYS = frozenset(('assetAttributions', 'properties', 'tags', 'location'))
+
+
 class FlattenerHelper:
     """Helper class for data flattening operations"""
     
@@ -48,59 +55,33 @@ class FlattenerHelper:
         if not resource_attribution:
             return result
         
-        # Extract parent cloud information
-        parent_cloud = resource_attribution.get('parentCloud')
-        if parent_cloud and isinstance(parent_cloud, dict):
-            result['parent_cloud'] = parent_cloud.get('name') or None
-            result['parent_cloud_id'] = parent_cloud.get('identifier') or None
-            
-            # Extract parent cloud owner email
-            parent_cloud_lead = parent_cloud.get('lead')
-            if parent_cloud_lead and isinstance(parent_cloud_lead, dict):
-                result['parent_cloud_owner_email'] = parent_cloud_lead.get('emailId') or None
-            else:
-                result['parent_cloud_owner_email'] = None
-        else:
-            result['parent_cloud'] = None
-            result['parent_cloud_id'] = None
-            result['parent_cloud_owner_email'] = None
-        
-        # Extract cloud information
-        cloud = resource_attribution.get('cloud')
-        if cloud and isinstance(cloud, dict):
-            result['cloud'] = cloud.get('name') or None
-            result['cloud_id'] = cloud.get('identifier') or None
-            
-            # Extract cloud owner email
-            cloud_lead = cloud.get('lead')
-            if cloud_lead and isinstance(cloud_lead, dict):
-                result['cloud_owner_email'] = cloud_lead.get('emailId') or None
-            else:
-                result['cloud_owner_email'] = None
-        else:
-            result['cloud'] = None
-            result['cloud_id'] = None
-            result['cloud_owner_email'] = None
-        
-        # Extract team information
-        team = resource_attribution.get('team')
-        if team and isinstance(team, dict):
-            result['team'] = team.get('name') or None
-            result['team_id'] = team.get('identifier') or None
-            
-            # Extract team owner email
-            team_lead = team.get('lead')
-            if team_lead and isinstance(team_lead, dict):
-                result['team_owner_email'] = team_lead.get('emailId') or None
-            else:
-                result['team_owner_email'] = None
-        else:
-            result['team'] = None
-            result['team_id'] = None
-            result['team_owner_email'] = None
-        
+        FlattenerHelper._fill_ownership(result, resource_attribution)
         return result
     
+    @staticmethod
+    def _fill_ownership(result: Dict[str, Optional[str]], attribution: Dict[str, Any]) -> None:
+        """
+        Fill parent cloud, cloud and team name/id/owner email from one attribution.
+        
+        Each entity is looked up once and read through a local reference;
+        fields of missing or malformed entities stay None.
+        
+        Args:
+            result: Ownership dictionary pre-filled with None values (updated in place)
+            attribution: Attribution dictionary
+        """
+        for source_key, prefix in _OWNERSHIP_ENTITIES:
+            entity = attribution.get(source_key)
+            if not entity or not isinstance(entity, dict):
+                continue
+            result[prefix] = entity.get('name') or None
+            result[f'{prefix}_id'] = entity.get('identifier') or None
+            
+            # Extract owner email
+            lead = entity.get('lead')
+            if lead and isinstance(lead, dict):
+                result[f'{prefix}_owner_email'] = lead.get('emailId') or None
+    
     @staticmethod
     def extract_all_ownership_info(asset_attributions: List[Dict[str, Any]]) -> List[Dict[str, Optional[str]]]:
         """
@@ -128,57 +109,7 @@ class FlattenerHelper:
                 'team_owner_email': None
             }
             
-            # Extract parent cloud information
-            parent_cloud = attribution.get('parentCloud')
-            if parent_cloud and isinstance(parent_cloud, dict):
-                result['parent_cloud'] = parent_cloud.get('name') or None
-                result['parent_cloud_id'] = parent_cloud.get('identifier') or None
-                
-                # Extract parent cloud owner email
-                parent_cloud_lead = parent_cloud.get('lead')
-                if parent_cloud_lead and isinstance(parent_cloud_lead, dict):
-                    result['parent_cloud_owner_email'] = parent_cloud_lead.get('emailId') or None
-                else:
-                    result['parent_cloud_owner_email'] = None
-            else:
-                result['parent_cloud'] = None
-                result['parent_cloud_id'] = None
-                result['parent_cloud_owner_email'] = None
-            
-            # Extract cloud information
-            cloud = attribution.get('cloud')
-            if cloud and isinstance(cloud, dict):
-                result['cloud'] = cloud.get('name') or None
-                result['cloud_id'] = cloud.get('identifier') or None
-                
-                # Extract cloud owner email
-                cloud_lead = cloud.get('lead')
-                if cloud_lead and isinstance(cloud_lead, dict):
-                    result['cloud_owner_email'] = cloud_lead.get('emailId') or None
-                else:
-                    result['cloud_owner_email'] = None
-            else:
-                result['cloud'] = None
-                result['cloud_id'] = None
-                result['cloud_owner_email'] = None
-            
-            # Extract team information
-            team = attribution.get('team')
-            if team and isinstance(team, dict):
-                result['team'] = team.get('name') or None
-                result['team_id'] = team.get('identifier') or None
-                
-                # Extract team owner email
-                team_lead = team.get('lead')
-                if team_lead and isinstance(team_lead, dict):
-                    result['team_owner_email'] = team_lead.get('emailId') or None
-                else:
-                    result['team_owner_email'] = None
-            else:
-                result['team'] = None
-                result['team_id'] = None
-                result['team_owner_email'] = None
-            
+            FlattenerHelper._fill_ownership(result, attribution)
             results.append(result)
         
         return results
@@ -299,7 +230,7 @@ class FlattenerHelper:
         
         # Keep only simple top-level fields (strings, numbers, booleans, null)
         for key, value in asset.items():
-            if key in ['assetAttributions', 'properties', 'tags', 'location']:
+            if key in _NESTED_KEYS:
                 # Skip these - we'll process them separately or exclude them
                 continue
             elif isinstance(value, (str, int, float, bool)) or value is None:
@@ -310,16 +241,11 @@ class FlattenerHelper:
         # Process ONLY assetAttributions for ownership information
         attributions = asset.get('assetAttributions')
         if attributions and isinstance(attributions, list):
-            ownership_info = FlattenerHelper.extract_ownership_info(attributions)
-            flattened.update(ownership_info)
-        
-        # Process ONLY properties
-        properties_info = FlattenerHelper.extract_properties_from_asset(asset)
-        flattened.update(properties_info)
+            flattened.update(FlattenerHelper.extract_ownership_info(attributions))
         
-        # Process ONLY tags
-        tags_info = FlattenerHelper.extract_tags_from_asset(asset)
-        flattened.update(tags_info)
+        # Process ONLY properties and tags (both helpers validate their input)
+        flattened.update(FlattenerHelper.extract_properties(asset.get('properties')))
+        flattened.update(FlattenerHelper.extract_tags(asset.get('tags')))
         
         return flattened
     
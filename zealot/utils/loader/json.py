@@ -12,6 +12,7 @@ Example:
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -53,7 +54,12 @@ class JSONLoader:
         This method only discovers available JSON files without loading their content.
         Files are read from disk on each access.
         """
-        self.file_list = [f.stem for f in self.json_folder.glob("*.json")]
+        # os.scandir avoids glob's per-entry pattern matching and Path construction
+        with os.scandir(self.json_folder) as entries:
+            self.file_list = [
+                entry.name[:-len('.json')] for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
     
     def _load_file(self, filename: str) -> Optional[Dict[str, Any]]:
         """